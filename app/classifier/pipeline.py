@@ -18,6 +18,7 @@ Die Pipeline ist zustandslos – alle Abhängigkeiten werden injiziert.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from dataclasses import dataclass, field
@@ -45,6 +46,7 @@ from app.classifier.resolver import (
     resolve_classification,
 )
 from app.claude.client import (
+    MAX_PDF_SIZE_BYTES,
     ClassificationResponse,
     ClaudeAPIError,
     ClaudeClient,
@@ -188,9 +190,15 @@ class ClassificationPipeline:
         start_time = time.monotonic()
 
         try:
-            # Schritt 1: PDF von Paperless herunterladen
+            # Schritt 1: PDF und Metadaten von Paperless laden – unabhängige
+            # Requests, daher parallel.  Die Metadaten werden hier frisch
+            # geholt (nicht aus der Poller-Liste), da _apply_result() Tags
+            # und Custom Fields per Read-Modify-Write zurückschreibt.
             logger.info("Pipeline Start: Dokument %d", document_id)
-            pdf_bytes = await self._download_pdf(document_id)
+            pdf_bytes, doc = await asyncio.gather(
+                self._download_pdf(document_id),
+                self._paperless.get_document(document_id),
+            )
 
             # Schritt 2: Lokale PDF-Analyse + Modellwahl
             pdf_analysis = analyze_pdf(pdf_bytes)
@@ -201,7 +209,6 @@ class ClassificationPipeline:
             # Dokument bereits verarbeitet hat (ki_status gesetzt).
             # Paperless' eigener Auto-Matcher setzt oft falsche Korrespondenten
             # auf NEU-Dokumente – diese dürfen die Modellwahl nicht beeinflussen.
-            doc = await self._paperless.get_document(document_id)
             ki_status_value = doc.get_custom_field_value(CF_KI_STATUS)
             correspondent_known = (
                 doc.correspondent is not None
@@ -280,7 +287,7 @@ class ClassificationPipeline:
             # Rate-Limit (429) oder Server-Überlast (529): Dokument NICHT als
             # Error markieren – NEU-Tag bleibt, ki_status bleibt null.
             # Exception wird an den Poller weitergereicht, der den Zyklus abbricht.
-            if isinstance(exc, ClaudeAPIError) and exc.status_code in (429, 529):
+            if isinstance(exc, ClaudeAPIError) and exc.is_rate_limited:
                 logger.warning(
                     "Rate-Limit/Überlast bei Dokument %d (HTTP %d) – "
                     "Dokument bleibt unverändert für nächsten Zyklus",
@@ -335,12 +342,12 @@ class ClassificationPipeline:
         # E-026: "NEU" ist ein Workflow-Trigger, kein semantischer Tag.
         # Claude soll ihn weder sehen noch vorschlagen.
         data = PromptData(
-            correspondents=cache.get_all_correspondent_names(),
-            document_types=cache.get_all_document_type_names(),
+            correspondents=list(cache.get_all_correspondent_names()),
+            document_types=list(cache.get_all_document_type_names()),
             tags=[t for t in cache.get_all_tag_names() if t != "NEU"],
-            storage_paths=cache.get_all_storage_path_names(),
-            person_options=cache.get_select_option_labels(CF_PERSON),
-            house_register_options=cache.get_select_option_labels(CF_HAUS_REGISTER),
+            storage_paths=list(cache.get_all_storage_path_names()),
+            person_options=list(cache.get_select_option_labels(CF_PERSON)),
+            house_register_options=list(cache.get_select_option_labels(CF_HAUS_REGISTER)),
         )
 
         # Schema-Analyse-Regeln aus SQLite laden (AP-11)
@@ -387,10 +394,27 @@ class ClassificationPipeline:
 
         Verwendet das Original (nicht die archivierte Version), damit
         Claude den physischen Zustand sieht (Stempel, Scans, etc.).
+        Der Download wird gestreamt und abgebrochen, sobald das PDF die
+        Größengrenze der Claude-API überschreitet – ein zu großes PDF wird
+        so nie vollständig in den Speicher geladen.
+
+        Raises:
+            ValueError: Wenn das PDF größer als MAX_PDF_SIZE_BYTES ist.
         """
-        pdf_bytes = await self._paperless.get_document_content(
+        chunks: list[bytes] = []
+        size = 0
+        async for chunk in self._paperless.stream_document_content(
             document_id, original=True,
-        )
+        ):
+            size += len(chunk)
+            if size > MAX_PDF_SIZE_BYTES:
+                raise ValueError(
+                    f"PDF ist zu groß: mehr als "
+                    f"{MAX_PDF_SIZE_BYTES / (1024 * 1024):.0f} MB "
+                    f"(Dokument {document_id}, Download abgebrochen)"
+                )
+            chunks.append(chunk)
+        pdf_bytes = b"".join(chunks)
         logger.debug(
             "PDF heruntergeladen: Dokument %d, %d bytes",
             document_id, len(pdf_bytes),
@@ -456,24 +480,24 @@ class ClassificationPipeline:
                         name, exc,
                     )
 
-        # Neue Tags
+        # Neue Tags – ein Dokument bringt oft mehrere mit, daher parallel
+        # anlegen (Fehler loggt create_many_tags pro Tag)
         if self._config.auto_create_tags:
+            # Duplikate (Groß-/Kleinschreibung egal wie im Cache) nur einmal
+            new_tag_names: dict[str, str] = {}
             for name in resolved.create_new_tags:
-                if self._paperless.cache.get_tag_id(name) is not None:
-                    continue
-                try:
-                    created = await self._paperless.create_tag(name)
+                if self._paperless.cache.get_tag_id(name) is None:
+                    new_tag_names.setdefault(name.lower(), name)
+            if new_tag_names:
+                created_tags = await self._paperless.create_many_tags(
+                    [{"name": name} for name in new_tag_names.values()],
+                )
+                for created in created_tags:
                     result.created_tags.append(
-                        {"name": name, "id": created.id}
+                        {"name": created.name, "id": created.id}
                     )
                     resolved.tag_ids.append(created.id)
                     cache_dirty = True
-                    logger.info("Tag angelegt: '%s' (ID %d)", name, created.id)
-                except PaperlessError as exc:
-                    logger.warning(
-                        "Tag '%s' konnte nicht angelegt werden: %s",
-                        name, exc,
-                    )
 
         # Neue Speicherpfade
         if self._config.auto_create_storage_paths:
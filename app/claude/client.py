@@ -34,6 +34,11 @@ class ClaudeConfigError(ClaudeError):
     """Fehlende oder ungültige Konfiguration (z.B. kein API-Key)."""
 
 
+# Rate-Limit (429) und Server-Überlast (529): transient – das Dokument wird
+# nicht als Error markiert, der Poller bricht den Zyklus ab (ERRATA E-010)
+RATE_LIMIT_STATUS_CODES: frozenset[int] = frozenset({429, 529})
+
+
 class ClaudeAPIError(ClaudeError):
     """Fehler bei der Kommunikation mit der Claude API."""
 
@@ -41,6 +46,11 @@ class ClaudeAPIError(ClaudeError):
         super().__init__(message)
         self.status_code = status_code
 
+    @property
+    def is_rate_limited(self) -> bool:
+        """True bei Rate-Limit oder Überlast (siehe RATE_LIMIT_STATUS_CODES)."""
+        return self.status_code in RATE_LIMIT_STATUS_CODES
+
 
 class ClaudeResponseError(ClaudeError):
     """Antwort von Claude konnte nicht geparst oder validiert werden."""
@@ -12,6 +12,23 @@ from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class FatalConfigError(SystemExit):
+    """Ungültige oder unvollständige Konfiguration – Start nicht möglich.
+
+    Erbt von SystemExit, damit der Prozess ohne Traceback-Kaskade mit
+    Exit-Code 78 (EX_CONFIG aus sysexits.h) endet.
+    """
+
+    EXIT_CODE = 78
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+        super().__init__(self.EXIT_CODE)
+
+    def __str__(self) -> str:
+        return self.message
+
+
 class ProcessingMode(str, Enum):
     """Verarbeitungsmodus für neue Dokumente."""
     IMMEDIATE = "immediate"   # Sofort per API verarbeiten
@@ -103,6 +120,11 @@ class Settings(BaseSettings):
         ge=10,
         description="Intervall in Sekunden zwischen Polling-Durchläufen",
     )
+    poll_batch_size: int = Field(
+        default=20,
+        ge=1,
+        description="Maximale Anzahl NEU-Dokumente pro Polling-Durchlauf",
+    )
     processing_mode: ProcessingMode = Field(
         default=ProcessingMode.IMMEDIATE,
         description="Verarbeitungsmodus: immediate, batch, hybrid",
@@ -149,6 +171,11 @@ class Settings(BaseSettings):
         """Pfad zur SQLite-Datenbank."""
         return self.data_dir / "classifier.db"
 
+    @property
+    def lookup_cache_path(self) -> Path:
+        """Pfad zum persistierten Paperless-Stammdaten-Cache."""
+        return self.data_dir / "lookup_cache.json"
+
     @property
     def log_dir(self) -> Path:
         """Pfad zum Log-Verzeichnis."""
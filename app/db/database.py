@@ -327,6 +327,10 @@ class Database:
     def __init__(self, db_path: Path | str) -> None:
         self._db_path = Path(db_path) if isinstance(db_path, str) else db_path
         self._connection: aiosqlite.Connection | None = None
+        # Wird nach jedem committeten Kostendatensatz erhöht
+        self._cost_data_version = 0
+        # Memo für get_cache_savings(): (Jahr, Monat, Kostenversion) → USD
+        self._cache_savings_memo: tuple[tuple[int, int, int], float] | None = None
 
     async def initialize(self) -> None:
         """Erstellt Verbindung, setzt PRAGMAs und führt Schema-Migration aus."""
@@ -563,6 +567,9 @@ class Database:
         )
 
         await conn.commit()
+        # Erst nach dem Commit: ein zwischenzeitlich gespeichertes Memo
+        # trägt die alte Version und wird beim nächsten Lesen verworfen
+        self._cost_data_version += 1
 
         logger.debug(
             "Verarbeitungsdatensatz gespeichert: paperless_id=%d, "
@@ -1063,6 +1070,11 @@ class Database:
         Cache-Tokens jeweils erzeugt hat, verwenden wir den gewichteten
         Durchschnitt aus den Modell-Zählern.
 
+        Das Ergebnis wird memoisiert: Solange seit dem letzten Aufruf
+        kein Kostendatensatz über insert_processed_document() committet
+        wurde, wird die Aggregation über daily_costs übersprungen.  Die
+        Kosten-Seite ruft diese Methode bei jedem Rendern auf.
+
         Returns:
             Geschätzte Ersparnis in USD.
         """
@@ -1071,6 +1083,25 @@ class Database:
         m = month or now.month
         prefix = f"{y:04d}-{m:02d}-%"
 
+        memo_key = (y, m, self._cost_data_version)
+        if self._cache_savings_memo is not None:
+            cached_key, cached_value = self._cache_savings_memo
+            if cached_key == memo_key:
+                return cached_value
+
+        savings = await self._compute_cache_savings(prefix)
+        self._cache_savings_memo = (memo_key, savings)
+        return savings
+
+    async def _compute_cache_savings(self, prefix: str) -> float:
+        """Berechnet die Cache-Ersparnis für ein Monats-Präfix (ohne Memo).
+
+        Args:
+            prefix: LIKE-Muster für daily_costs.date (z.B. "2026-02-%").
+
+        Returns:
+            Geschätzte Ersparnis in USD.
+        """
         conn = self.connection
         cursor = await conn.execute(
             """
@@ -1085,13 +1116,14 @@ class Database:
             (prefix,),
         )
         row = await cursor.fetchone()
-        if not row or int(row["cache_tokens"]) == 0:
+        if not row:
+            return 0.0
+
+        # SUM über INTEGER-Spalten liefert bereits int – kein Cast nötig
+        cache_tokens, sonnet_n, haiku_n, opus_n = row
+        if cache_tokens == 0:
             return 0.0
 
-        cache_tokens = int(row["cache_tokens"])
-        sonnet_n = int(row["sonnet_n"])
-        haiku_n = int(row["haiku_n"])
-        opus_n = int(row["opus_n"])
         total_n = sonnet_n + haiku_n + opus_n
 
         if total_n == 0:
@@ -2,39 +2,124 @@
 
 Seiteneffekt-frei: Wird sowohl vom Health-Check-Endpoint in main.py
 als auch von der Einstellungsseite (settings.py) importiert.
+Der Fallback-HTTP-Client wird erst beim ersten Health-Check erstellt.
 """
 
 from __future__ import annotations
 
+import functools
+import os
+import time
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
 from app.config import Settings
 
+# Abstand zwischen echten Schreibtests im Datenverzeichnis (Sekunden)
+WRITE_PROBE_INTERVAL_SECONDS = 3600.0
 
-async def check_paperless_reachable(settings: Settings) -> dict[str, Any]:
+# time.monotonic() des letzten erfolgreichen Schreibtests
+_last_write_probe: float | None = None
+
+# Testdatei und Inhalt des Schreibtests (Bytes: kein Text-Encoding)
+_WRITE_PROBE_NAME = ".write_test"
+_WRITE_PROBE_PAYLOAD = b"ok"
+
+# Fallback-Client für Paperless-Probes, falls kein gemeinsamer Client aus
+# app.state übergeben wird.  Lazy erstellt und über Aufrufe hinweg
+# wiederverwendet (Keep-Alive statt TCP-Handshake pro Probe).
+_health_client: httpx.AsyncClient | None = None
+
+
+# Relativer Probe-Pfad – base_url und Authorization-Header sind bereits
+# im jeweiligen Client hinterlegt
+_PROBE_PATH = "/api/"
+
+
+def _get_health_client(settings: Settings) -> httpx.AsyncClient:
+    """Gibt den Fallback-Client zurück und erstellt ihn beim ersten Aufruf.
+
+    URL und Auth-Header werden einmalig im Client hinterlegt statt bei
+    jeder Probe neu formatiert.
+    """
+    global _health_client
+    if _health_client is None:
+        client_kwargs: dict[str, Any] = {
+            "base_url": settings.paperless_url,
+            "headers": {"Authorization": f"Token {settings.paperless_api_token}"},
+            "timeout": httpx.Timeout(5.0),
+            "follow_redirects": True,
+            "limits": httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        }
+        try:
+            # HTTP/2: parallele Probes teilen sich eine Verbindung
+            _health_client = httpx.AsyncClient(http2=True, **client_kwargs)
+        except ImportError:
+            # h2 nicht installiert → HTTP/1.1
+            _health_client = httpx.AsyncClient(**client_kwargs)
+    return _health_client
+
+
+async def close_health_client() -> None:
+    """Schließt den Fallback-Client (beim Shutdown)."""
+    global _health_client
+    if _health_client is not None:
+        await _health_client.aclose()
+        _health_client = None
+
+
+@dataclass(slots=True)
+class HealthReport:
+    """Antwort des /health-Endpoints.
+
+    Wird von orjson direkt serialisiert (Felder in Definitionsreihenfolge),
+    ohne Umweg über ein verschachteltes dict.  Die einzelnen Checks bleiben
+    dicts, da ihre Felder je nach Ergebnis variieren.
+    """
+
+    status: str                           # healthy, degraded, unhealthy
+    timestamp: str                        # ISO-8601, UTC
+    version: str
+    checks: dict[str, dict[str, Any]]
+
+
+async def check_paperless_reachable(
+    settings: Settings,
+    client: httpx.AsyncClient | None = None,
+) -> dict[str, Any]:
     """Prüft ob die Paperless-ngx API erreichbar ist.
 
     Kein harter Fehler – der Classifier kann auch bei Paperless-Downtime
     laufen (wartet dann auf nächsten Polling-Zyklus).
+
+    Args:
+        settings: Anwendungseinstellungen (URL, Token).
+        client: Gemeinsamer httpx Client aus app.state (Connection-Pool
+            mit dem PaperlessClient, base_url und Auth-Header gesetzt,
+            siehe create_http_client).  None = modulweiter Fallback-Client.
     """
+    http = client or _get_health_client(settings)
     try:
-        async with httpx.AsyncClient(timeout=5.0, follow_redirects=True) as client:
-            response = await client.get(
-                f"{settings.paperless_url}/api/",
-                headers={"Authorization": f"Token {settings.paperless_api_token}"},
-            )
-            if response.status_code == 200:
-                return {"status": "ok", "url": settings.paperless_url}
-            return {
-                "status": "error",
-                "url": settings.paperless_url,
-                "http_status": response.status_code,
-            }
+        # HEAD statt GET: nur der Statuscode zählt, der API-Root-Body
+        # muss weder erzeugt noch übertragen werden
+        response = await http.head(_PROBE_PATH)
+        if response.status_code == 405:
+            # HEAD nicht erlaubt → GET streamen, Body ungelesen verwerfen
+            async with http.stream("GET", _PROBE_PATH) as streamed:
+                response = streamed
     except httpx.RequestError as e:
         return {"status": "unreachable", "url": settings.paperless_url, "error": str(e)}
 
+    if response.status_code == 200:
+        return {"status": "ok", "url": settings.paperless_url}
+    return {
+        "status": "error",
+        "url": settings.paperless_url,
+        "http_status": response.status_code,
+    }
+
 
 def check_api_key_present(settings: Settings) -> dict[str, Any]:
     """Prüft ob der Anthropic API-Key konfiguriert ist.
@@ -42,19 +127,50 @@ def check_api_key_present(settings: Settings) -> dict[str, Any]:
     Validiert nur das Vorhandensein, nicht die Gültigkeit
     (das würde einen API-Call kosten).
     """
-    if settings.anthropic_api_key and settings.anthropic_api_key.startswith("sk-ant-"):
-        return {"status": "ok", "key_prefix": settings.anthropic_api_key[:12] + "..."}
+    return _api_key_status(settings.anthropic_api_key)
+
+
+@functools.lru_cache(maxsize=2)
+def _api_key_status(api_key: str | None) -> dict[str, Any]:
+    """Ergebnis von check_api_key_present, memoisiert pro Key.
+
+    Der Key ändert sich zur Laufzeit nicht (Settings-Singleton), daher
+    wird das dict nur einmal gebaut.  Aufrufer dürfen es nicht verändern.
+    """
+    if api_key and api_key.startswith("sk-ant-"):
+        return {"status": "ok", "key_prefix": api_key[:12] + "..."}
     return {"status": "not_configured"}
 
 
 def check_sqlite_writable(settings: Settings) -> dict[str, Any]:
-    """Prüft ob das Datenverzeichnis beschreibbar ist."""
+    """Prüft ob das Datenverzeichnis beschreibbar ist.
+
+    Ein echter Schreibtest (Datei anlegen und löschen) läuft nur beim
+    ersten Aufruf und danach höchstens alle WRITE_PROBE_INTERVAL_SECONDS.
+    Dazwischen genügt os.access() – der Health-Check soll das Dateisystem
+    nicht bei jeder Abfrage beschreiben.
+    """
+    global _last_write_probe
+
+    data_dir = settings.data_dir
+    now = time.monotonic()
+
+    if _last_write_probe is not None and now - _last_write_probe < WRITE_PROBE_INTERVAL_SECONDS:
+        if os.access(data_dir, os.W_OK):
+            return {"status": "ok", "path": str(data_dir)}
+        return {
+            "status": "error",
+            "path": str(data_dir),
+            "error": "Keine Schreibrechte auf das Datenverzeichnis",
+        }
+
     try:
-        data_dir = settings.data_dir
         data_dir.mkdir(parents=True, exist_ok=True)
-        test_file = data_dir / ".write_test"
-        test_file.write_text("ok")
+        test_file = data_dir / _WRITE_PROBE_NAME
+        test_file.write_bytes(_WRITE_PROBE_PAYLOAD)
         test_file.unlink()
-        return {"status": "ok", "path": str(data_dir)}
     except OSError as e:
-        return {"status": "error", "path": str(settings.data_dir), "error": str(e)}
+        return {"status": "error", "path": str(data_dir), "error": str(e)}
+
+    _last_write_probe = now
+    return {"status": "ok", "path": str(data_dir)}
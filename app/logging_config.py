@@ -3,6 +3,8 @@
 Setzt strukturiertes Logging auf mit:
 - Console-Handler (stdout) für `docker logs`
 - RotatingFileHandler für persistente Logs
+- QueueHandler/QueueListener: Die eigentliche I/O (stdout, Datei, Rotation)
+  läuft in einem Hintergrund-Thread, nicht im asyncio Event-Loop
 - Logger-Hierarchie: paperless_classifier.{component}
   → app, classifier, paperless, claude, costs, schema_matrix
 
@@ -11,8 +13,10 @@ sodass per grep/Filter nach Komponente gesucht werden kann.
 """
 
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 
@@ -30,16 +34,53 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 MAX_BYTES = 5 * 1024 * 1024
 BACKUP_COUNT = 3
 
+# Aktiver QueueListener (wird bei erneutem setup_logging() ersetzt)
+_listener: QueueListener | None = None
 
-def setup_logging(log_level: str = "INFO", log_dir: Path | None = None) -> None:
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter, der den Zeitstempel nur einmal pro Sekunde formatiert.
+
+    LOG_DATE_FORMAT hat Sekundenauflösung – alle Records derselben
+    Sekunde teilen sich den einmal per strftime erzeugten String.
+    Wird nur im QueueListener-Thread verwendet, daher ohne Lock.
+    """
+
+    def __init__(self, fmt: str, datefmt: str) -> None:
+        super().__init__(fmt, datefmt=datefmt)
+        self._last_second = -1
+        self._last_timestamp = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_timestamp = time.strftime(
+                datefmt or self.datefmt or LOG_DATE_FORMAT,
+                self.converter(second),
+            )
+        return self._last_timestamp
+
+
+def setup_logging(log_level: str = "INFO", log_dir: Path | None = None) -> QueueListener:
     """Konfiguriert das Logging-System.
 
+    Die Anwendungs-Logger schreiben nur in eine Queue (QueueHandler);
+    ein QueueListener-Thread übernimmt die blockierenden Schreibzugriffe
+    auf stdout und die Log-Datei.
+
     Args:
         log_level: Log-Level als String (DEBUG, INFO, WARNING, ERROR)
         log_dir: Verzeichnis für Log-Dateien. None = nur stdout.
+
+    Returns:
+        Der gestartete QueueListener – beim Shutdown mit stop() beenden,
+        damit die Queue vollständig geleert wird.
     """
+    global _listener
+
     level = getattr(logging, log_level.upper(), logging.INFO)
-    formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+    formatter = _CachedTimeFormatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
 
     # Root-Logger für die Anwendung
     root_logger = logging.getLogger(ROOT_LOGGER_NAME)
@@ -47,14 +88,20 @@ def setup_logging(log_level: str = "INFO", log_dir: Path | None = None) -> None:
 
     # Vorhandene Handler entfernen (bei erneutem Aufruf, z.B. in Tests)
     root_logger.handlers.clear()
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+    handlers: list[logging.Handler] = []
 
     # Console-Handler: stdout für Docker-Logs
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # Datei-Handler: nur wenn log_dir angegeben und beschreibbar
+    log_dir_error: OSError | None = None
     if log_dir is not None:
         try:
             log_dir.mkdir(parents=True, exist_ok=True)
@@ -67,9 +114,21 @@ def setup_logging(log_level: str = "INFO", log_dir: Path | None = None) -> None:
             )
             file_handler.setLevel(level)
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except OSError as e:
-            root_logger.warning("Log-Verzeichnis nicht beschreibbar: %s – nur stdout aktiv", e)
+            log_dir_error = e
+
+    # Producer-Seite: nur ein queue.put() pro Log-Record
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    if log_dir_error is not None:
+        root_logger.warning(
+            "Log-Verzeichnis nicht beschreibbar: %s – nur stdout aktiv", log_dir_error,
+        )
 
     # Externe Libraries leiser stellen
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -78,6 +137,8 @@ def setup_logging(log_level: str = "INFO", log_dir: Path | None = None) -> None:
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("nicegui").setLevel(logging.WARNING)
 
+    return _listener
+
 
 def get_logger(component: str) -> logging.Logger:
     """Gibt einen Logger für die angegebene Komponente zurück.
@@ -4,20 +4,29 @@ Startet den NiceGUI-Server mit integriertem Health-Check-Endpoint.
 NiceGUI bringt FastAPI/Uvicorn mit – kein separater Server nötig.
 
 Lifecycle:
-1. startup()        – Logging, Config-Validierung (synchron)
-2. async_startup()  – Clients initialisieren, Cache laden, Poller starten
-3. ... Server läuft ...
-4. shutdown()       – Poller stoppen, Clients schließen
+1. async_startup()  – einziger Startup-Hook:
+   a) startup()     – Logging, Config-Validierung (synchron)
+   b) DB-Init parallel zu Modul-Vorladen und Paperless-Cache-Load
+   c) Claude-Client (nach DB-Init) parallel zum Paperless-Cache-Load
+   d) Pipeline und Poller starten
+2. ... Server läuft ...
+3. shutdown()       – Poller stoppen, Clients schließen
 """
 
 import asyncio
+import functools
 import sys
+import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson
+from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse, Response
 from nicegui import app, ui
 
-from app.config import Settings, get_settings
+from app.config import FatalConfigError, Settings, get_settings
 from app.logging_config import get_logger, setup_logging
 import app.state as state
 
@@ -51,43 +60,182 @@ def get_cost_tracker() -> Any:
 # --- Health-Check Logik ---
 
 # Health-Check-Funktionen (ausgelagert, um zirkuläre Imports zu vermeiden)
-from app.health import check_api_key_present, check_paperless_reachable, check_sqlite_writable
+from app.health import (
+    HealthReport,
+    check_api_key_present,
+    check_paperless_reachable,
+    check_sqlite_writable,
+    close_health_client,
+)
 
 
 # --- FastAPI-Endpoint auf dem NiceGUI-Server ---
 
-@app.get("/health")
-async def health_check() -> dict[str, Any]:
+# Eigener Router statt @app.get(): Die Route wird unten nur dann
+# eingehängt, wenn sie noch nicht existiert (mehrfacher Import, Tests).
+health_router = APIRouter()
+
+_UTC = timezone.utc
+
+
+def _utc_timestamp() -> str:
+    """Aktueller UTC-Zeitpunkt als ISO-String (sekundengenau)."""
+    return _iso_second(int(time.time()))
+
+
+@functools.lru_cache(maxsize=4)
+def _iso_second(second: int) -> str:
+    """Formatiert eine Unix-Sekunde als UTC-ISO-String (memoisiert)."""
+    return datetime.fromtimestamp(second, _UTC).isoformat()
+
+
+# Gültigkeit des gecachten Health-Ergebnisses (Sekunden).  Mehrere
+# Abfragen kurz hintereinander (Docker, Monitoring, curl) teilen sich
+# so eine Ausführung der Subsystem-Checks.
+HEALTH_CACHE_TTL_SECONDS = 3.0
+
+# Bis zu diesem Alter wird ein abgelaufenes Ergebnis noch sofort
+# ausgeliefert und parallel im Hintergrund erneuert (stale-while-revalidate).
+HEALTH_STALE_MAX_SECONDS = 30.0
+
+# Letztes Health-Ergebnis: (time.monotonic() bei Erstellung, Report,
+# bereits serialisierter JSON-Body).  Cache-Treffer liefern die Bytes
+# ohne erneute Serialisierung aus.
+_last_health: tuple[float, HealthReport, bytes] | None = None
+
+# Serialisiert Aktualisierungen, damit parallele Abfragen nur einen
+# Check-Durchlauf auslösen
+_health_refresh_lock = asyncio.Lock()
+_health_refresh_task: asyncio.Task[bytes] | None = None
+
+
+@health_router.get("/health", response_class=ORJSONResponse)
+async def health_check(nocache: bool = False) -> Response:
     """Health-Check-Endpoint für Docker und Monitoring.
 
     Gibt HTTP 200 zurück solange der Service grundsätzlich läuft.
     Einzelne Subsysteme können 'degraded' sein ohne den Container zu killen.
+    Das Ergebnis wird HEALTH_CACHE_TTL_SECONDS lang wiederverwendet;
+    ältere Ergebnisse (bis HEALTH_STALE_MAX_SECONDS) werden ausgeliefert
+    und im Hintergrund aktualisiert.
+
+    Args:
+        nocache: True (``/health?nocache=1``) erzwingt eine frische Prüfung.
 
     Returns:
         JSON mit Status jeder Komponente und Gesamtstatus.
     """
+    global _health_refresh_task
+
+    if not nocache and _last_health is not None:
+        cached_at, _, cached_body = _last_health
+        age = time.monotonic() - cached_at
+        if age < HEALTH_CACHE_TTL_SECONDS:
+            return _json_bytes_response(cached_body)
+        if age < HEALTH_STALE_MAX_SECONDS:
+            if _health_refresh_task is None or _health_refresh_task.done():
+                _health_refresh_task = asyncio.create_task(
+                    _refresh_health(),
+                    name="health-refresh",
+                )
+            return _json_bytes_response(cached_body)
+
+    body = await _refresh_health(force=nocache)
+    return _json_bytes_response(body)
+
+
+def _json_bytes_response(body: bytes) -> Response:
+    """Response aus einem fertig serialisierten JSON-Body."""
+    return Response(content=body, media_type="application/json")
+
+
+async def _refresh_health(force: bool = False) -> bytes:
+    """Führt die Health-Checks aus und aktualisiert den Cache.
+
+    Wartende Aufrufer bekommen das Ergebnis des gerade laufenden
+    Durchlaufs, statt selbst erneut zu prüfen.
+
+    Args:
+        force: True = auch bei frischem Cache-Eintrag neu prüfen.
+
+    Returns:
+        Der serialisierte JSON-Body des aktuellen Reports.
+    """
+    global _last_health
+
+    async with _health_refresh_lock:
+        if (
+            not force
+            and _last_health is not None
+            and time.monotonic() - _last_health[0] < HEALTH_CACHE_TTL_SECONDS
+        ):
+            return _last_health[2]
+
+        report = await _build_health_report()
+        # Einmal pro Aktualisierung serialisieren – orjson verarbeitet die
+        # Dataclass direkt, FastAPIs jsonable_encoder wird übersprungen
+        body = orjson.dumps(report)
+        _last_health = (time.monotonic(), report, body)
+        return body
+
+
+# Zuletzt serialisierter Poller-Status: (Schlüssel aus den Statusfeldern, dict).
+# Der Status ändert sich höchstens einmal pro Dokument bzw. Zyklus.
+_poller_info_cache: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+
+_POLLER_NOT_INITIALIZED: dict[str, Any] = {"status": "not_initialized"}
+
+
+def _poller_info(poller: Any) -> dict[str, Any]:
+    """Poller-Status als dict für den Health-Report (memoisiert).
+
+    Enum-Wert und isoformat() werden nur neu berechnet, wenn sich eines
+    der ausgegebenen Felder geändert hat.
+    """
+    global _poller_info_cache
+
+    if poller is None:
+        return _POLLER_NOT_INITIALIZED
+
+    status = poller.status
+    key = (
+        status.state,
+        status.documents_processed,
+        status.documents_errored,
+        status.last_run_at,
+        status.cost_limit_paused,
+    )
+    if _poller_info_cache is not None and _poller_info_cache[0] == key:
+        return _poller_info_cache[1]
+
+    info = {
+        "status": status.state.value,
+        "documents_processed": status.documents_processed,
+        "documents_errored": status.documents_errored,
+        "last_run_at": (
+            status.last_run_at.isoformat() if status.last_run_at else None
+        ),
+        "cost_limit_paused": status.cost_limit_paused,
+    }
+    _poller_info_cache = (key, info)
+    return info
+
+
+async def _build_health_report() -> HealthReport:
+    """Führt alle Subsystem-Checks aus und baut die Health-Antwort."""
     settings = get_settings()
 
-    paperless = await check_paperless_reachable(settings)
+    # Nur die I/O-Checks überlappen: Netzwerk-Probe und Dateisystem-Zugriff
+    # (im Thread, blockiert den Event-Loop nicht).  Der API-Key-Check ist
+    # ein reiner String-Vergleich und läuft direkt.
     api_key = check_api_key_present(settings)
-    database = check_sqlite_writable(settings)
+    paperless, database = await asyncio.gather(
+        check_paperless_reachable(settings, state.http),
+        asyncio.to_thread(check_sqlite_writable, settings),
+    )
 
     # Poller-Status einbeziehen
-    poller_info: dict[str, Any]
-    if state.poller is not None:
-        poller_info = {
-            "status": state.poller.status.state.value,
-            "documents_processed": state.poller.status.documents_processed,
-            "documents_errored": state.poller.status.documents_errored,
-            "last_run_at": (
-                state.poller.status.last_run_at.isoformat()
-                if state.poller.status.last_run_at
-                else None
-            ),
-            "cost_limit_paused": state.poller.status.cost_limit_paused,
-        }
-    else:
-        poller_info = {"status": "not_initialized"}
+    poller_info = _poller_info(state.poller)
 
     # Gesamtstatus: healthy wenn DB schreibbar und API-Key vorhanden,
     # degraded wenn Paperless nicht erreichbar, unhealthy bei DB/Key-Problemen
@@ -113,16 +261,49 @@ async def health_check() -> dict[str, Any]:
     else:
         overall = "unhealthy"
 
-    return {
-        "status": overall,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "version": "0.1.0",
-        "checks": checks,
-    }
+    return HealthReport(
+        status=overall,
+        timestamp=_utc_timestamp(),
+        version="0.1.0",
+        checks=checks,
+    )
+
+
+if "/health" not in {getattr(route, "path", None) for route in app.routes}:
+    app.include_router(health_router)
 
 
 # --- Startup / Shutdown ---
 
+class _StatsSummary:
+    """Lazy Log-Argument für Cache-Statistiken ("tags=12, ...").
+
+    Der Join wird erst im Formatter ausgeführt, d.h. nur wenn der
+    Log-Record tatsächlich ausgegeben wird.
+    """
+
+    __slots__ = ("_stats",)
+
+    def __init__(self, stats: dict[str, int]) -> None:
+        self._stats = stats
+
+    def __str__(self) -> str:
+        return ", ".join(f"{k}={v}" for k, v in self._stats.items())
+
+
+def _preload_modules() -> None:
+    """Importiert die schweren Client-/Pipeline-Module vorab.
+
+    Läuft per asyncio.to_thread() parallel zur Datenbank-Initialisierung,
+    damit Bytecode-Laden und Modul-Init (anthropic, httpx, PyMuPDF) nicht
+    erst beim ersten Zugriff im Event-Loop anfallen.  Die späteren
+    Funktions-Imports finden die Module dann bereits in sys.modules.
+    """
+    import app.classifier.pipeline
+    import app.claude.client
+    import app.paperless.client  # noqa: F401
+
+
 async def _paperless_reconnect_loop(settings: Settings) -> None:
     """Hintergrund-Task: Versucht periodisch Paperless zu erreichen.
 
@@ -146,6 +327,8 @@ async def _paperless_reconnect_loop(settings: Settings) -> None:
             client = PaperlessClient(
                 base_url=settings.paperless_url,
                 token=settings.paperless_api_token,
+                client=state.http,
+                cache_path=settings.lookup_cache_path,
             )
             await client.__aenter__()
             stats = await client.load_cache()
@@ -154,7 +337,7 @@ async def _paperless_reconnect_loop(settings: Settings) -> None:
             logger.info(
                 "Paperless-Reconnect erfolgreich nach %d Versuchen: %s",
                 attempt,
-                ", ".join(f"{k}={v}" for k, v in stats.items()),
+                _StatsSummary(stats),
             )
 
             # Jetzt den Rest der Initialisierung nachholen
@@ -173,6 +356,47 @@ async def _paperless_reconnect_loop(settings: Settings) -> None:
                     pass
 
 
+async def _init_claude(settings: Settings) -> bool:
+    """Initialisiert CostTracker und ClaudeClient.
+
+    Unabhängig von Paperless – läuft beim Startup parallel zum
+    Paperless-Verbindungsaufbau.  Setzt eine initialisierte Datenbank
+    voraus (falls vorhanden), damit der CostTracker sie nutzen kann.
+
+    Returns:
+        True wenn state.claude_client danach verfügbar ist.
+    """
+    if not settings.anthropic_api_key:
+        logger.warning(
+            "ANTHROPIC_API_KEY nicht konfiguriert – "
+            "Poller wird nicht gestartet (Klassifizierung nicht möglich)"
+        )
+        return False
+
+    try:
+        from app.claude.client import ClaudeClient
+        from app.claude.cost_tracker import CostTracker
+
+        if state.cost_tracker is None:
+            state.cost_tracker = CostTracker()
+            if state.database:
+                state.cost_tracker.set_database(state.database)
+
+        state.claude_client = ClaudeClient(
+            api_key=settings.anthropic_api_key,
+            default_model=settings.default_model,
+            cost_tracker=state.cost_tracker,
+            monthly_cost_limit_usd=settings.monthly_cost_limit_usd,
+        )
+        await state.claude_client.__aenter__()
+        logger.info("ClaudeClient initialisiert")
+    except Exception as exc:
+        logger.error("ClaudeClient konnte nicht initialisiert werden: %s", exc)
+        state.claude_client = None
+        return False
+    return True
+
+
 async def _initialize_remaining_services(settings: Settings) -> None:
     """Initialisiert Claude-Client, Pipeline und Poller.
 
@@ -183,35 +407,8 @@ async def _initialize_remaining_services(settings: Settings) -> None:
     (E-033: Gemeinsame Init-Logik für Startup und Reconnect)
     """
     # --- ClaudeClient + CostTracker ---
-    if state.claude_client is None:
-        if not settings.anthropic_api_key:
-            logger.warning(
-                "ANTHROPIC_API_KEY nicht konfiguriert – "
-                "Poller wird nicht gestartet (Klassifizierung nicht möglich)"
-            )
-            return
-
-        try:
-            from app.claude.client import ClaudeClient
-            from app.claude.cost_tracker import CostTracker
-
-            if state.cost_tracker is None:
-                state.cost_tracker = CostTracker()
-                if state.database:
-                    state.cost_tracker.set_database(state.database)
-
-            state.claude_client = ClaudeClient(
-                api_key=settings.anthropic_api_key,
-                default_model=settings.default_model,
-                cost_tracker=state.cost_tracker,
-                monthly_cost_limit_usd=settings.monthly_cost_limit_usd,
-            )
-            await state.claude_client.__aenter__()
-            logger.info("ClaudeClient initialisiert")
-        except Exception as exc:
-            logger.error("ClaudeClient konnte nicht initialisiert werden: %s", exc)
-            state.claude_client = None
-            return
+    if state.claude_client is None and not await _init_claude(settings):
+        return
 
     # --- Pipeline ---
     if state.pipeline is None:
@@ -246,48 +443,92 @@ async def _initialize_remaining_services(settings: Settings) -> None:
         except Exception as exc:
             logger.error("Poller konnte nicht gestartet werden: %s", exc)
 
-def startup() -> None:
-    """Wird beim Serverstart ausgeführt – initialisiert Logging und prüft Config.
+def _load_settings_or_fail() -> Settings:
+    """Lädt die Settings oder bricht mit FatalConfigError ab.
+
+    Schreibt den Fehler vorher als einzeiliges JSON nach stderr,
+    damit Orchestrator und Log-Sammler ihn maschinell auswerten können.
 
-    Synchroner Handler: Läuft vor async_startup().
+    Raises:
+        FatalConfigError: Wenn die Konfiguration ungültig ist.
     """
     try:
-        settings = get_settings()
+        return get_settings()
     except Exception as e:
         # Ohne gültige Config kann der Container nicht starten
-        print(f"FATAL: Konfigurationsfehler – {e}", file=sys.stderr)
-        sys.exit(1)
+        error = FatalConfigError(f"Konfigurationsfehler – {e}")
+        sys.stderr.write(
+            orjson.dumps({
+                "fatal": "config",
+                "error": str(error),
+                "exit_code": error.code,
+            }).decode()
+            + "\n"
+        )
+        sys.stderr.flush()
+        raise error from e
+
+
+_BANNER_LINE = "=" * 60
+_STARTUP_BANNER = f"{_BANNER_LINE}\nPaperless Claude Classifier v0.1.0 startet\n{_BANNER_LINE}"
+_SHUTDOWN_BANNER = f"{_BANNER_LINE}\nPaperless Claude Classifier beendet\n{_BANNER_LINE}"
+_STARTUP_SUMMARY_FORMAT = (
+    "Konfiguration:\n"
+    "  Paperless-URL: %s\n"
+    "  Standard-Modell: %s\n"
+    "  Verarbeitungsmodus: %s\n"
+    "  Polling-Intervall: %ds\n"
+    "  Kostenlimit: $%.2f/Monat\n"
+    "  Log-Level: %s\n"
+    "  Datenverzeichnis: %s"
+)
+
+
+def startup() -> Settings:
+    """Initialisiert Logging und prüft die Config.
+
+    Synchroner Teil des Serverstarts, wird als erster Schritt von
+    async_startup() in einem Worker-Thread aufgerufen (mkdir und das
+    Öffnen der Log-Datei blockieren so nicht den Event-Loop).
 
-    setup_logging(
+    Returns:
+        Die validierten Settings (Singleton aus get_settings()).
+    """
+    settings = _load_settings_or_fail()
+
+    # Datenverzeichnis einmalig anlegen (Health-Check prüft danach nur noch
+    # die Schreibrechte)
+    try:
+        settings.data_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        print(f"WARNUNG: Datenverzeichnis nicht anlegbar – {exc}", file=sys.stderr)
+
+    state.log_listener = setup_logging(
         log_level=settings.log_level.value,
         log_dir=settings.log_dir,
     )
 
-    logger.info("=" * 60)
-    logger.info("Paperless Claude Classifier v0.1.0 startet")
-    logger.info("=" * 60)
-    logger.info("Paperless-URL: %s", settings.paperless_url)
-    logger.info("Standard-Modell: %s", settings.default_model)
-    logger.info("Verarbeitungsmodus: %s", settings.processing_mode.value)
-    logger.info("Polling-Intervall: %ds", settings.polling_interval_seconds)
-    logger.info("Kostenlimit: $%.2f/Monat", settings.monthly_cost_limit_usd)
-    logger.info("Log-Level: %s", settings.log_level.value)
-    logger.info("Datenverzeichnis: %s", settings.data_dir)
+    # Banner und Konfigurationsübersicht als je ein Log-Record
+    logger.info(_STARTUP_BANNER)
+    logger.info(
+        _STARTUP_SUMMARY_FORMAT,
+        settings.paperless_url,
+        settings.default_model,
+        settings.processing_mode.value,
+        settings.polling_interval_seconds,
+        settings.monthly_cost_limit_usd,
+        settings.log_level.value,
+        settings.data_dir,
+    )
+    return settings
 
 
-async def async_startup() -> None:
-    """Asynchrone Initialisierung: DB, Clients, Cache, Poller starten.
+async def _init_database(settings: Settings) -> None:
+    """Initialisiert die SQLite-Datenbank (AP-06).
 
-    Wird nach startup() ausgeführt, wenn der Event-Loop bereits läuft.
-    Fehler hier sind nicht fatal – der Container läuft weiter im
-    degraded-Modus (Health-Check zeigt den Zustand an).
+    Fehler sind nicht fatal – der Classifier kann ohne DB laufen
+    (Degraded-Modus), state.database bleibt dann None.
     """
-    # State-Variablen werden über app.state gesetzt
-    
-
-    settings = get_settings()
-
-    # --- SQLite-Datenbank (AP-06) ---
     try:
         from app.db.database import Database
 
@@ -297,17 +538,87 @@ async def async_startup() -> None:
     except Exception as exc:
         logger.error("Datenbank konnte nicht initialisiert werden: %s", exc)
         state.database = None
-        # Kein Return – der Classifier kann ohne DB laufen (Degraded-Modus)
 
-    # --- PaperlessClient (mit Retry bei Verbindungsfehler, E-033) ---
+
+# Gesamtzeit für Paperless-Verbindungsversuche beim Startup (10 Minuten)
+PAPERLESS_STARTUP_RETRY_SECONDS = 600
+
+# Backoff für den Hintergrund-Refresh nach einem Warmstart (Sekunden)
+CACHE_REVALIDATE_BASE_INTERVAL = 10.0
+CACHE_REVALIDATE_MAX_INTERVAL = 300.0
+
+# Referenz auf den Hintergrund-Refresh des Stammdaten-Caches (sonst GC-Risiko)
+_cache_revalidate_task: asyncio.Task[None] | None = None
+
+
+async def _revalidate_paperless_cache(client: Any) -> None:
+    """Lädt den Stammdaten-Cache nach einem Warmstart frisch aus Paperless.
+
+    Wiederholt mit exponentiellem Backoff, bis der Refresh gelingt –
+    bis dahin arbeitet der Classifier mit dem persistierten Stand.
+    Abbruch über _cancel_background_tasks() beim Shutdown.
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            stats = await client.load_cache()
+        except Exception as exc:
+            retry_interval = min(
+                CACHE_REVALIDATE_BASE_INTERVAL * 2 ** (attempt - 1),
+                CACHE_REVALIDATE_MAX_INTERVAL,
+            )
+            logger.warning(
+                "Stammdaten-Cache konnte nicht aktualisiert werden "
+                "(Versuch %d, arbeite mit persistiertem Stand) – "
+                "nächster Versuch in %.0fs: %s",
+                attempt, retry_interval, exc,
+            )
+            await asyncio.sleep(retry_interval)
+            continue
+        logger.info("Stammdaten-Cache aktualisiert: %s", _StatsSummary(stats))
+        return
+
+
+def _schedule_cache_revalidation(client: Any) -> None:
+    """Startet den Hintergrund-Refresh des persistierten Caches."""
+    global _cache_revalidate_task
+    _cache_revalidate_task = asyncio.create_task(
+        _revalidate_paperless_cache(client),
+        name="paperless-cache-refresh",
+    )
+
+
+async def _await_database(db_task: asyncio.Task[None]) -> None:
+    """Wartet auf den DB-Init-Task; Fehler führen zum Degraded-Modus."""
+    try:
+        await db_task
+    except Exception as exc:
+        logger.error("Datenbank konnte nicht initialisiert werden: %s", exc)
+        state.database = None
+
+
+async def _connect_paperless(settings: Settings) -> bool:
+    """Baut den PaperlessClient auf und lädt den Stammdaten-Cache.
+
+    Versucht es mit exponentiellem Backoff, bis
+    PAPERLESS_STARTUP_RETRY_SECONDS abgelaufen sind (E-033).
+
+    Returns:
+        True wenn state.paperless_client verbunden und der Cache geladen ist.
+    """
     paperless_initialized = False
-    max_retry_seconds = 600  # 10 Minuten Gesamtzeit
-    retry_interval = 10.0    # Start: 10 Sekunden
+    max_retry_seconds = PAPERLESS_STARTUP_RETRY_SECONDS
+    base_interval = 10.0     # Start: 10 Sekunden
     max_interval = 60.0      # Deckel: 60 Sekunden
-    total_waited = 0.0
     attempt = 0
 
-    while not paperless_initialized and total_waited < max_retry_seconds:
+    # Monotone Deadline statt aufsummierter Wartezeiten
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    deadline = started_at + max_retry_seconds
+
+    while not paperless_initialized and loop.time() < deadline:
         attempt += 1
         try:
             from app.paperless.client import PaperlessClient
@@ -316,32 +627,44 @@ async def async_startup() -> None:
                 state.paperless_client = PaperlessClient(
                     base_url=settings.paperless_url,
                     token=settings.paperless_api_token,
+                    client=state.http,
+                    cache_path=settings.lookup_cache_path,
                 )
                 await state.paperless_client.__aenter__()
 
+            # Warmstart: persistierten Cache sofort nutzen und im Hintergrund
+            # gegen Paperless aktualisieren (stale-while-revalidate).
+            # Nur wenn Paperless erreichbar ist – sonst greifen Backoff und
+            # Degraded-Modus wie beim Kaltstart (E-033).
+            stats = None
+            if attempt == 1:
+                stats = await state.paperless_client.load_cache_from_disk()
+                if stats is not None:
+                    probe = await check_paperless_reachable(settings, state.http)
+                    if probe["status"] != "ok":
+                        raise RuntimeError(
+                            f"Erreichbarkeitsprüfung fehlgeschlagen: {probe}"
+                        )
+                    _schedule_cache_revalidation(state.paperless_client)
+
             # Stammdaten-Cache laden (Korrespondenten, Tags, Typen, Pfade)
-            stats = await state.paperless_client.load_cache()
+            if stats is None:
+                stats = await state.paperless_client.load_cache()
 
             paperless_initialized = True
             logger.info("PaperlessClient initialisiert")
             logger.info(
                 "Stammdaten-Cache geladen: %s",
-                ", ".join(f"{k}={v}" for k, v in stats.items()),
+                _StatsSummary(stats),
             )
         except Exception as exc:
-            if attempt == 1:
-                logger.warning(
-                    "Paperless nicht erreichbar (Versuch %d): %s – "
-                    "Retry mit Backoff (max. %ds)",
-                    attempt, exc, max_retry_seconds,
-                )
-            else:
-                logger.warning(
-                    "Paperless nicht erreichbar (Versuch %d, %.0fs/%ds): %s – "
-                    "nächster Versuch in %.0fs",
-                    attempt, total_waited, max_retry_seconds, exc,
-                    retry_interval,
-                )
+            retry_interval = min(base_interval * 2 ** (attempt - 1), max_interval)
+            logger.warning(
+                "Paperless nicht erreichbar (Versuch %d, %.0fs/%ds): %s – "
+                "nächster Versuch in %.0fs",
+                attempt, loop.time() - started_at, max_retry_seconds, exc,
+                retry_interval,
+            )
 
             # PaperlessClient aufräumen falls teilweise initialisiert
             if state.paperless_client is not None:
@@ -352,83 +675,206 @@ async def async_startup() -> None:
                 state.paperless_client = None
 
             await asyncio.sleep(retry_interval)
-            total_waited += retry_interval
-            retry_interval = min(retry_interval * 2, max_interval)
+
+    return paperless_initialized
+
+
+# Wird beim ersten async_startup()-Aufruf gesetzt (gilt pro Modulobjekt)
+_startup_started = False
+
+# Hintergrund-Reconnect zu Paperless (nur im Degraded-Modus aktiv)
+_reconnect_task: asyncio.Task[None] | None = None
+
+
+async def async_startup() -> None:
+    """Startup-Hook: Config, Logging, DB, Clients, Cache, Poller.
+
+    Einziger bei NiceGUI registrierter Startup-Callback.  Führt zuerst
+    den synchronen Teil (startup()) aus und überlappt danach die
+    DB-Initialisierung mit dem Vorladen der schweren Module und dem
+    Laden des Paperless-Stammdaten-Caches.
+    Fehler nach der Config-Prüfung sind nicht fatal – der Container
+    läuft weiter im degraded-Modus (Health-Check zeigt den Zustand an).
+    """
+    # Schutz gegen doppelte Ausführung des Callbacks innerhalb desselben
+    # Modulobjekts (z.B. doppelt registriert) – Pool, DB und Poller dürfen
+    # nicht zweimal entstehen.  Gegen erneuten Import hilft das nicht:
+    # __main__ und app.main haben je eigene Globals (siehe ERRATA E-017).
+    global _startup_started
+    if _startup_started:
+        logger.warning("async_startup() bereits ausgeführt – übersprungen")
+        return
+    _startup_started = True
+
+    # State-Variablen werden über app.state gesetzt; Dateisystem-Zugriffe
+    # (Datenverzeichnis, Log-Datei) laufen im Thread
+    settings = await asyncio.to_thread(startup)
+
+    # uvloop wird von Uvicorn automatisch verwendet, wenn installiert
+    logger.info("Event-Loop: %s", type(asyncio.get_running_loop()).__module__)
+
+    # --- SQLite-Datenbank (AP-06) ---
+    # Läuft als eigener Task parallel zum Vorladen der Module und zum
+    # Paperless-Verbindungsaufbau inkl. Stammdaten-Cache; beide teilen
+    # keinen Zustand.  Abgewartet wird erst vor der Claude-Initialisierung.
+    db_task = asyncio.create_task(_init_database(settings), name="db-init")
+
+    try:
+        await asyncio.to_thread(_preload_modules)
+    except Exception as exc:
+        # Import-Fehler tauchen unten beim eigentlichen Import erneut auf
+        logger.warning("Vorladen der Module fehlgeschlagen: %s", exc)
+
+    # --- Gemeinsamer HTTP-Client (Health-Check + PaperlessClient) ---
+    if state.http is None:
+        try:
+            import httpx
+
+            from app.paperless.client import create_http_client
+
+            state.http = create_http_client(
+                settings.paperless_url,
+                settings.paperless_api_token,
+                # Kurze Defaults für den Health-Check; der PaperlessClient
+                # setzt seine eigenen Timeouts pro Request
+                timeout=httpx.Timeout(5.0, connect=2.0),
+            )
+        except Exception as exc:
+            # Kein Abbruch: PaperlessClient und Health-Check nutzen dann
+            # jeweils eigene Clients
+            logger.warning("Gemeinsamer HTTP-Client nicht verfügbar: %s", exc)
+            state.http = None
+
+    # --- PaperlessClient (E-033) und ClaudeClient parallel ---
+    # Der Claude-Zweig wartet nur auf die DB (für den CostTracker), nicht
+    # auf Paperless; der Stammdaten-Cache-Load läuft gleichzeitig.
+    async def _init_claude_after_db() -> None:
+        await _await_database(db_task)
+        await _init_claude(settings)
+
+    paperless_initialized, _ = await asyncio.gather(
+        _connect_paperless(settings),
+        _init_claude_after_db(),
+    )
 
     if not paperless_initialized:
         logger.error(
             "Paperless nach %ds nicht erreichbar – "
             "Container läuft im Degraded-Modus (kein Poller). "
             "Reconnect wird im Hintergrund versucht.",
-            max_retry_seconds,
+            PAPERLESS_STARTUP_RETRY_SECONDS,
         )
         state.paperless_client = None
         # Hintergrund-Task für periodische Reconnect-Versuche starten
-        asyncio.create_task(
+        global _reconnect_task
+        _reconnect_task = asyncio.create_task(
             _paperless_reconnect_loop(settings),
             name="paperless-reconnect",
         )
         return
 
-    # --- ClaudeClient, Pipeline, Poller (gemeinsame Init-Logik, E-033) ---
+    if state.claude_client is None:
+        # Claude-Init fehlgeschlagen (bereits geloggt) → kein Poller
+        return
+
+    # --- Pipeline, Poller (gemeinsame Init-Logik, E-033) ---
     await _initialize_remaining_services(settings)
 
 
+# Shutdown-Registry: state-Attribut → (Log-Bezeichnung, Close-Funktion).
+# Alle Services werden über _close_service() einheitlich behandelt.
+_SERVICE_CLOSERS: dict[str, tuple[str, Callable[[Any], Awaitable[Any]]]] = {
+    "poller": ("Poller", lambda svc: svc.stop()),
+    "claude_client": ("ClaudeClient", lambda svc: svc.__aexit__(None, None, None)),
+    "paperless_client": ("PaperlessClient", lambda svc: svc.__aexit__(None, None, None)),
+    "http": ("HTTP-Client", lambda svc: svc.aclose()),
+    "database": ("Datenbank", lambda svc: svc.close()),
+}
+
+# Stufen werden nacheinander abgearbeitet, Services innerhalb einer
+# Stufe parallel geschlossen (sie hängen nicht voneinander ab).
+_SHUTDOWN_STAGES: tuple[tuple[str, ...], ...] = (
+    ("poller",),                               # wartet auf aktuelles Dokument
+    ("claude_client", "paperless_client"),
+    ("http",),                                 # gemeinsamer Pool, nach PaperlessClient
+    ("database",),
+)
+
+
+async def _close_service(name: str) -> None:
+    """Schließt einen Service aus app.state und setzt ihn auf None.
+
+    Fehler werden geloggt, aber nicht weitergereicht – der Shutdown
+    soll alle übrigen Services trotzdem schließen.
+    """
+    service = getattr(state, name)
+    if service is None:
+        return
+
+    label, close = _SERVICE_CLOSERS[name]
+    try:
+        await close(service)
+        logger.info("%s geschlossen", label)
+    except Exception as exc:
+        logger.error("Fehler beim Schließen von %s: %s", label, exc)
+    setattr(state, name, None)
+
+
+async def _cancel_background_tasks() -> None:
+    """Bricht Reconnect-, Cache-Refresh- und Health-Refresh-Tasks ab.
+
+    Die Tasks nutzen die Clients, die danach geschlossen werden.
+    """
+    tasks = [
+        task
+        for task in (_reconnect_task, _cache_revalidate_task, _health_refresh_task)
+        if task is not None and not task.done()
+    ]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def shutdown() -> None:
     """Graceful Shutdown: Poller stoppen, Clients und DB schließen.
 
-    Wird beim Container-Stop (SIGTERM) aufgerufen.  Reihenfolge:
-    1. Poller stoppen (wartet auf aktuelles Dokument)
-    2. ClaudeClient schließen
-    3. PaperlessClient schließen
+    Wird beim Container-Stop (SIGTERM) aufgerufen.  Reihenfolge
+    (siehe _SHUTDOWN_STAGES):
+    1. Poller stoppen (wartet auf aktuelles Dokument), parallel dazu
+       Hintergrund-Tasks abbrechen
+    2. ClaudeClient und PaperlessClient schließen (parallel)
+    3. Gemeinsamen HTTP-Client schließen
     4. Datenbank schließen
     """
     # State-Variablen werden über app.state zurückgesetzt
 
     logger.info("Shutdown eingeleitet...")
 
-    # Poller stoppen
-    if state.poller is not None:
-        try:
-            await state.poller.stop()
-            logger.info("Poller gestoppt")
-        except Exception as exc:
-            logger.error("Fehler beim Stoppen des Pollers: %s", exc)
-        state.poller = None
-
-    # ClaudeClient schließen
-    if state.claude_client is not None:
-        try:
-            await state.claude_client.__aexit__(None, None, None)
-            logger.info("ClaudeClient geschlossen")
-        except Exception as exc:
-            logger.error("Fehler beim Schließen des ClaudeClients: %s", exc)
-        state.claude_client = None
+    # Hintergrund-Tasks müssen vor den Clients beendet sein; sie laufen
+    # unabhängig vom Poller und werden parallel zu dessen Stopp abgebrochen
+    first_stage, *later_stages = _SHUTDOWN_STAGES
+    await asyncio.gather(
+        _cancel_background_tasks(),
+        *(_close_service(name) for name in first_stage),
+    )
+    for stage in later_stages:
+        await asyncio.gather(*(_close_service(name) for name in stage))
 
-    # PaperlessClient schließen
-    if state.paperless_client is not None:
-        try:
-            await state.paperless_client.__aexit__(None, None, None)
-            logger.info("PaperlessClient geschlossen")
-        except Exception as exc:
-            logger.error("Fehler beim Schließen des PaperlessClients: %s", exc)
-        state.paperless_client = None
+    # Fallback-Client der Health-Checks (nur vorhanden ohne gemeinsamen Client)
+    try:
+        await close_health_client()
+    except Exception as exc:
+        logger.error("Fehler beim Schließen des Health-Check-Clients: %s", exc)
 
-    # Datenbank schließen (AP-06)
-    if state.database is not None:
-        try:
-            await state.database.close()
-            logger.info("Datenbank geschlossen")
-        except Exception as exc:
-            logger.error("Fehler beim Schließen der Datenbank: %s", exc)
-        state.database = None
+    logger.info(_SHUTDOWN_BANNER)
 
-    logger.info("=" * 60)
-    logger.info("Paperless Claude Classifier beendet")
-    logger.info("=" * 60)
+    # Logging-Queue leeren und Listener-Thread beenden (zuletzt, damit
+    # die Shutdown-Meldungen noch geschrieben werden)
+    if state.log_listener is not None:
+        state.log_listener.stop()
+        state.log_listener = None
 
 
-app.on_startup(startup)
 app.on_startup(async_startup)
 app.on_shutdown(shutdown)
 
@@ -444,7 +890,14 @@ register_pages()
 # --- Haupteinstiegspunkt ---
 
 def main() -> None:
-    """Startet den NiceGUI-Server."""
+    """Startet den NiceGUI-Server.
+
+    Die Config wird vor dem Serverstart geprüft: Bei Fehlern endet der
+    Prozess sofort mit Exit-Code 78, statt erst im Startup-Hook von
+    Uvicorn abzubrechen.
+    """
+    _load_settings_or_fail()
+
     ui.run(
         host="0.0.0.0",
         port=8501,
@@ -16,28 +16,76 @@ Typische Verwendung:
         docs = await client.get_documents(tags=[12])
 """
 
-from app.paperless.cache import LookupCache
-from app.paperless.client import PaperlessClient
-from app.paperless.exceptions import (
-    PaperlessAuthError,
-    PaperlessCacheError,
-    PaperlessConnectionError,
-    PaperlessError,
-    PaperlessNotFoundError,
-    PaperlessServerError,
-    PaperlessValidationError,
-)
-from app.paperless.models import (
-    Correspondent,
-    CustomFieldDefinition,
-    CustomFieldValue,
-    Document,
-    DocumentType,
-    PaginatedResponse,
-    SelectOption,
-    StoragePath,
-    Tag,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.paperless.cache import LookupCache
+    from app.paperless.client import PaperlessClient
+    from app.paperless.exceptions import (
+        PaperlessAuthError,
+        PaperlessCacheError,
+        PaperlessConnectionError,
+        PaperlessError,
+        PaperlessNotFoundError,
+        PaperlessRateLimitError,
+        PaperlessServerError,
+        PaperlessValidationError,
+    )
+    from app.paperless.models import (
+        Correspondent,
+        CustomFieldDefinition,
+        CustomFieldValue,
+        Document,
+        DocumentType,
+        PaginatedResponse,
+        SelectOption,
+        StoragePath,
+        Tag,
+    )
+
+# Lazy Loading (PEP 562): Ein Import von z.B. app.paperless.exceptions
+# lädt nicht mehr automatisch httpx, tenacity und alle Pydantic-Modelle.
+# Name → Submodul, aus dem der Name beim ersten Zugriff geladen wird.
+_LAZY_IMPORTS: dict[str, str] = {
+    "PaperlessClient": "app.paperless.client",
+    "LookupCache": "app.paperless.cache",
+    "Correspondent": "app.paperless.models",
+    "CustomFieldDefinition": "app.paperless.models",
+    "CustomFieldValue": "app.paperless.models",
+    "Document": "app.paperless.models",
+    "DocumentType": "app.paperless.models",
+    "PaginatedResponse": "app.paperless.models",
+    "SelectOption": "app.paperless.models",
+    "StoragePath": "app.paperless.models",
+    "Tag": "app.paperless.models",
+    "PaperlessAuthError": "app.paperless.exceptions",
+    "PaperlessCacheError": "app.paperless.exceptions",
+    "PaperlessConnectionError": "app.paperless.exceptions",
+    "PaperlessError": "app.paperless.exceptions",
+    "PaperlessNotFoundError": "app.paperless.exceptions",
+    "PaperlessRateLimitError": "app.paperless.exceptions",
+    "PaperlessServerError": "app.paperless.exceptions",
+    "PaperlessValidationError": "app.paperless.exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lädt öffentliche Namen beim ersten Zugriff aus dem Submodul."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Im Modul-Namespace ablegen → weitere Zugriffe ohne __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Client + Cache
@@ -59,6 +107,7 @@ __all__ = [
     "PaperlessConnectionError",
     "PaperlessError",
     "PaperlessNotFoundError",
+    "PaperlessRateLimitError",
     "PaperlessServerError",
     "PaperlessValidationError",
 ]
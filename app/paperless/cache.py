@@ -8,6 +8,8 @@ Cache-Strategie:
 - Automatische Invalidierung bei Neuanlage über den Client
 - Manueller Refresh über refresh() für die Web-UI
 - Kein TTL nötig – Stammdaten ändern sich nur durch den Classifier selbst
+- Optional als JSON-Datei persistiert (save_to_file/load_from_file), damit
+  ein Neustart sofort mit dem letzten Stand arbeiten kann
 
 ERRATA E-001: Select-Options sind Objekte mit {id, label}.
 Der Cache bietet Hilfsmethoden zum Auflösen von Label→Option-ID.
@@ -15,7 +17,12 @@ Der Cache bietet Hilfsmethoden zum Auflösen von Label→Option-ID.
 
 from __future__ import annotations
 
+import json
+import os
+import sys
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
 
 from app.logging_config import get_logger
 from app.paperless.exceptions import PaperlessCacheError
@@ -29,8 +36,59 @@ from app.paperless.models import (
 
 logger = get_logger("paperless")
 
+_ItemT = TypeVar("_ItemT", Correspondent, DocumentType, Tag, StoragePath, CustomFieldDefinition)
 
-@dataclass
+# Format-Version der Cache-Datei – bei inkompatiblen Änderungen erhöhen,
+# ältere Dateien werden dann ignoriert
+CACHE_FILE_VERSION = 1
+
+
+def _name_key(name: str) -> str:
+    """Schlüssel für die Name→ID-Mappings: lowercase und interniert.
+
+    Die Schlüssel leben so lange wie der Cache; interniert teilen sich
+    gleichlautende Namen über Kategorien hinweg ein String-Objekt.
+    """
+    return sys.intern(name.lower())
+
+
+def _build_indexes(items: list[_ItemT]) -> tuple[dict[int, _ItemT], dict[str, int]]:
+    """Baut ID→Objekt und Name→ID in einem Durchlauf über die Items."""
+    by_id: dict[int, _ItemT] = {}
+    by_name: dict[str, int] = {}
+    for item in items:
+        item_id = item.id
+        by_id[item_id] = item
+        by_name[_name_key(item.name)] = item_id
+    return by_id, by_name
+
+
+@dataclass(frozen=True, slots=True)
+class _SelectOptionIndex:
+    """Vorberechnete Lookups eines Select-Feldes (einmal pro Cache-Load)."""
+
+    ids_by_label: dict[str, str]
+    labels_by_id: dict[str, str]
+    labels: tuple[str, ...]
+
+    @classmethod
+    def from_field(cls, cf: CustomFieldDefinition) -> _SelectOptionIndex:
+        options = cf.select_options
+        ids_by_label: dict[str, str] = {}
+        for opt in options:
+            # Erstes Vorkommen gewinnt – wie die lineare Suche im Modell
+            ids_by_label.setdefault(sys.intern(opt.label), opt.id)
+        return cls(
+            ids_by_label=ids_by_label,
+            labels_by_id={opt.id: opt.label for opt in reversed(options)},
+            labels=tuple(opt.label for opt in options),
+        )
+
+
+_EMPTY_SELECT_INDEX = _SelectOptionIndex({}, {}, ())
+
+
+@dataclass(slots=True)
 class LookupCache:
     """Bidirektionaler Cache: ID→Objekt und Name→ID für alle Stammdaten.
 
@@ -56,16 +114,23 @@ class LookupCache:
     _storage_path_names: dict[str, int] = field(default_factory=dict)
     _custom_field_names: dict[str, int] = field(default_factory=dict)
 
+    # Select-Optionen pro Custom Field (Label↔ID), gebaut in set_custom_fields
+    _select_options: dict[int, _SelectOptionIndex] = field(default_factory=dict)
+
+    # Memoisierte Namenslisten für get_all_*_names(), pro Kategorie.
+    # Wird bei set_*/add_*/clear für die betroffene Kategorie verworfen.
+    _all_names: dict[str, tuple[str, ...]] = field(default_factory=dict)
+
+    # Summe aller ID→Objekt-Einträge über alle Kategorien (für is_loaded)
+    _entry_count: int = 0
+
+    # Memoisiertes Ergebnis von stats(); None nach jeder Änderung
+    _stats: dict[str, int] | None = None
+
     @property
     def is_loaded(self) -> bool:
         """True wenn mindestens eine Kategorie geladen wurde."""
-        return bool(
-            self.correspondents
-            or self.document_types
-            or self.tags
-            or self.storage_paths
-            or self.custom_fields
-        )
+        return self._entry_count > 0
 
     # =========================================================================
     # Befüllung (wird vom Client aufgerufen)
@@ -73,32 +138,51 @@ class LookupCache:
 
     def set_correspondents(self, items: list[Correspondent]) -> None:
         """Cache mit Korrespondenten befüllen."""
-        self.correspondents = {item.id: item for item in items}
-        self._correspondent_names = {item.name.lower(): item.id for item in items}
+        self._entry_count -= len(self.correspondents)
+        self.correspondents, self._correspondent_names = _build_indexes(items)
+        self._entry_count += len(self.correspondents)
+        self._stats = None
+        self._all_names.pop("correspondents", None)
         logger.debug("Cache: %d Korrespondenten geladen", len(items))
 
     def set_document_types(self, items: list[DocumentType]) -> None:
         """Cache mit Dokumenttypen befüllen."""
-        self.document_types = {item.id: item for item in items}
-        self._document_type_names = {item.name.lower(): item.id for item in items}
+        self._entry_count -= len(self.document_types)
+        self.document_types, self._document_type_names = _build_indexes(items)
+        self._entry_count += len(self.document_types)
+        self._stats = None
+        self._all_names.pop("document_types", None)
         logger.debug("Cache: %d Dokumenttypen geladen", len(items))
 
     def set_tags(self, items: list[Tag]) -> None:
         """Cache mit Tags befüllen."""
-        self.tags = {item.id: item for item in items}
-        self._tag_names = {item.name.lower(): item.id for item in items}
+        self._entry_count -= len(self.tags)
+        self.tags, self._tag_names = _build_indexes(items)
+        self._entry_count += len(self.tags)
+        self._stats = None
+        self._all_names.pop("tags", None)
         logger.debug("Cache: %d Tags geladen", len(items))
 
     def set_storage_paths(self, items: list[StoragePath]) -> None:
         """Cache mit Speicherpfaden befüllen."""
-        self.storage_paths = {item.id: item for item in items}
-        self._storage_path_names = {item.name.lower(): item.id for item in items}
+        self._entry_count -= len(self.storage_paths)
+        self.storage_paths, self._storage_path_names = _build_indexes(items)
+        self._entry_count += len(self.storage_paths)
+        self._stats = None
+        self._all_names.pop("storage_paths", None)
         logger.debug("Cache: %d Speicherpfade geladen", len(items))
 
     def set_custom_fields(self, items: list[CustomFieldDefinition]) -> None:
         """Cache mit Custom-Field-Definitionen befüllen."""
-        self.custom_fields = {item.id: item for item in items}
-        self._custom_field_names = {item.name.lower(): item.id for item in items}
+        self._entry_count -= len(self.custom_fields)
+        self.custom_fields, self._custom_field_names = _build_indexes(items)
+        self._entry_count += len(self.custom_fields)
+        self._stats = None
+        self._select_options = {
+            item.id: _SelectOptionIndex.from_field(item)
+            for item in items
+            if item.data_type == "select"
+        }
         logger.debug("Cache: %d Custom Fields geladen", len(items))
 
     def clear(self) -> None:
@@ -113,6 +197,10 @@ class LookupCache:
         self._tag_names.clear()
         self._storage_path_names.clear()
         self._custom_field_names.clear()
+        self._select_options.clear()
+        self._all_names.clear()
+        self._entry_count = 0
+        self._stats = None
         logger.debug("Cache geleert")
 
     # =========================================================================
@@ -121,23 +209,39 @@ class LookupCache:
 
     def add_correspondent(self, item: Correspondent) -> None:
         """Einzelnen Korrespondenten zum Cache hinzufügen."""
+        if item.id not in self.correspondents:
+            self._entry_count += 1
+            self._stats = None
         self.correspondents[item.id] = item
-        self._correspondent_names[item.name.lower()] = item.id
+        self._correspondent_names[_name_key(item.name)] = item.id
+        self._all_names.pop("correspondents", None)
 
     def add_document_type(self, item: DocumentType) -> None:
         """Einzelnen Dokumenttyp zum Cache hinzufügen."""
+        if item.id not in self.document_types:
+            self._entry_count += 1
+            self._stats = None
         self.document_types[item.id] = item
-        self._document_type_names[item.name.lower()] = item.id
+        self._document_type_names[_name_key(item.name)] = item.id
+        self._all_names.pop("document_types", None)
 
     def add_tag(self, item: Tag) -> None:
         """Einzelnen Tag zum Cache hinzufügen."""
+        if item.id not in self.tags:
+            self._entry_count += 1
+            self._stats = None
         self.tags[item.id] = item
-        self._tag_names[item.name.lower()] = item.id
+        self._tag_names[_name_key(item.name)] = item.id
+        self._all_names.pop("tags", None)
 
     def add_storage_path(self, item: StoragePath) -> None:
         """Einzelnen Speicherpfad zum Cache hinzufügen."""
+        if item.id not in self.storage_paths:
+            self._entry_count += 1
+            self._stats = None
         self.storage_paths[item.id] = item
-        self._storage_path_names[item.name.lower()] = item.id
+        self._storage_path_names[_name_key(item.name)] = item.id
+        self._all_names.pop("storage_paths", None)
 
     # =========================================================================
     # Lookup: ID → Objekt
@@ -190,34 +294,31 @@ class LookupCache:
     # =========================================================================
     # Lookup: Name → ID mit Exception (wenn Pflicht)
     # =========================================================================
+    # Gemeinsamer Helper mit direktem Dict-Zugriff statt Umweg über get_*_id().
 
-    def require_correspondent_id(self, name: str) -> int:
-        """Wie get_correspondent_id, wirft PaperlessCacheError wenn nicht gefunden."""
-        result = self.get_correspondent_id(name)
+    @staticmethod
+    def _require(names: dict[str, int], entity_type: str, name: str) -> int:
+        """Name→ID-Lookup, wirft PaperlessCacheError wenn nicht gefunden."""
+        result = names.get(name.lower())
         if result is None:
-            raise PaperlessCacheError("Korrespondent", name)
+            raise PaperlessCacheError(entity_type, name)
         return result
 
+    def require_correspondent_id(self, name: str) -> int:
+        """Wie get_correspondent_id, wirft PaperlessCacheError wenn nicht gefunden."""
+        return self._require(self._correspondent_names, "Korrespondent", name)
+
     def require_document_type_id(self, name: str) -> int:
         """Wie get_document_type_id, wirft PaperlessCacheError wenn nicht gefunden."""
-        result = self.get_document_type_id(name)
-        if result is None:
-            raise PaperlessCacheError("Dokumenttyp", name)
-        return result
+        return self._require(self._document_type_names, "Dokumenttyp", name)
 
     def require_tag_id(self, name: str) -> int:
         """Wie get_tag_id, wirft PaperlessCacheError wenn nicht gefunden."""
-        result = self.get_tag_id(name)
-        if result is None:
-            raise PaperlessCacheError("Tag", name)
-        return result
+        return self._require(self._tag_names, "Tag", name)
 
     def require_storage_path_id(self, name: str) -> int:
         """Wie get_storage_path_id, wirft PaperlessCacheError wenn nicht gefunden."""
-        result = self.get_storage_path_id(name)
-        if result is None:
-            raise PaperlessCacheError("Speicherpfad", name)
-        return result
+        return self._require(self._storage_path_names, "Speicherpfad", name)
 
     # =========================================================================
     # Custom Field Select-Options Lookup
@@ -236,10 +337,10 @@ class LookupCache:
         Returns:
             Interne Option-ID (z.B. "1IOdA6xDPBZuJdvD") oder None
         """
-        cf = self.custom_fields.get(field_id)
-        if cf is None:
+        index = self._select_options.get(field_id)
+        if index is None:
             return None
-        return cf.get_option_id_by_label(label)
+        return index.ids_by_label.get(label)
 
     def get_select_option_label(self, field_id: int, option_id: str) -> str | None:
         """Label einer Select-Option anhand der internen ID.
@@ -251,10 +352,10 @@ class LookupCache:
         Returns:
             Label-String oder None
         """
-        cf = self.custom_fields.get(field_id)
-        if cf is None:
+        index = self._select_options.get(field_id)
+        if index is None:
             return None
-        return cf.get_option_label_by_id(option_id)
+        return index.labels_by_id.get(option_id)
 
     def require_select_option_id(self, field_id: int, label: str) -> str:
         """Wie get_select_option_id, wirft PaperlessCacheError wenn nicht gefunden."""
@@ -269,39 +370,111 @@ class LookupCache:
     # Hilfsmethoden für die Klassifizierungs-Pipeline
     # =========================================================================
 
-    def get_all_correspondent_names(self) -> list[str]:
+    def _names_of(self, category: str, items: dict[int, Any]) -> tuple[str, ...]:
+        """Namensliste einer Kategorie, gebaut beim ersten Zugriff nach einer Änderung."""
+        names = self._all_names.get(category)
+        if names is None:
+            names = tuple(item.name for item in items.values())
+            self._all_names[category] = names
+        return names
+
+    def get_all_correspondent_names(self) -> tuple[str, ...]:
         """Alle Korrespondenten-Namen (für den System-Prompt)."""
-        return [c.name for c in self.correspondents.values()]
+        return self._names_of("correspondents", self.correspondents)
 
-    def get_all_document_type_names(self) -> list[str]:
+    def get_all_document_type_names(self) -> tuple[str, ...]:
         """Alle Dokumenttyp-Namen (für den System-Prompt)."""
-        return [dt.name for dt in self.document_types.values()]
+        return self._names_of("document_types", self.document_types)
 
-    def get_all_tag_names(self) -> list[str]:
+    def get_all_tag_names(self) -> tuple[str, ...]:
         """Alle Tag-Namen (für den System-Prompt)."""
-        return [t.name for t in self.tags.values()]
+        return self._names_of("tags", self.tags)
 
-    def get_all_storage_path_names(self) -> list[str]:
+    def get_all_storage_path_names(self) -> tuple[str, ...]:
         """Alle Speicherpfad-Namen (für den System-Prompt)."""
-        return [sp.name for sp in self.storage_paths.values()]
+        return self._names_of("storage_paths", self.storage_paths)
 
-    def get_select_option_labels(self, field_id: int) -> list[str]:
+    def get_select_option_labels(self, field_id: int) -> tuple[str, ...]:
         """Alle Labels eines Select-Feldes (für den System-Prompt)."""
-        cf = self.custom_fields.get(field_id)
-        if cf is None:
-            return []
-        return [opt.label for opt in cf.select_options]
+        return self._select_options.get(field_id, _EMPTY_SELECT_INDEX).labels
+
+    # =========================================================================
+    # Persistenz (Warmstart nach Neustart)
+    # =========================================================================
+
+    def save_to_file(self, path: Path) -> None:
+        """Schreibt alle Stammdaten als JSON-Datei (atomar via Rename).
+
+        Blockierende Datei-I/O – aus async Code per asyncio.to_thread aufrufen.
+
+        Args:
+            path: Zieldatei (z.B. /app/data/lookup_cache.json)
+        """
+        payload = {
+            "version": CACHE_FILE_VERSION,
+            "correspondents": [c.model_dump(mode="json") for c in self.correspondents.values()],
+            "document_types": [d.model_dump(mode="json") for d in self.document_types.values()],
+            "tags": [t.model_dump(mode="json") for t in self.tags.values()],
+            "storage_paths": [sp.model_dump(mode="json") for sp in self.storage_paths.values()],
+            "custom_fields": [cf.model_dump(mode="json") for cf in self.custom_fields.values()],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+        logger.debug("Cache gespeichert: %s", path)
+
+    def load_from_file(self, path: Path) -> bool:
+        """Befüllt den Cache aus einer mit save_to_file() geschriebenen Datei.
+
+        Blockierende Datei-I/O – aus async Code per asyncio.to_thread aufrufen.
+
+        Args:
+            path: Cache-Datei
+
+        Returns:
+            True wenn die Datei gelesen und übernommen wurde, False wenn sie
+            fehlt, unlesbar ist oder eine andere Format-Version hat.
+        """
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            if payload.get("version") != CACHE_FILE_VERSION:
+                logger.info("Cache-Datei %s hat veraltetes Format – ignoriert", path)
+                return False
+            correspondents = [Correspondent.model_validate(r) for r in payload["correspondents"]]
+            document_types = [DocumentType.model_validate(r) for r in payload["document_types"]]
+            tags = [Tag.model_validate(r) for r in payload["tags"]]
+            storage_paths = [StoragePath.model_validate(r) for r in payload["storage_paths"]]
+            custom_fields = [CustomFieldDefinition.model_validate(r) for r in payload["custom_fields"]]
+        except FileNotFoundError:
+            return False
+        except Exception as exc:
+            logger.warning("Cache-Datei %s nicht lesbar: %s", path, exc)
+            return False
+
+        self.set_correspondents(correspondents)
+        self.set_document_types(document_types)
+        self.set_tags(tags)
+        self.set_storage_paths(storage_paths)
+        self.set_custom_fields(custom_fields)
+        return True
 
     # =========================================================================
     # Debug / Statistik
     # =========================================================================
 
     def stats(self) -> dict[str, int]:
-        """Gibt die Anzahl gecachter Einträge pro Kategorie zurück."""
-        return {
-            "correspondents": len(self.correspondents),
-            "document_types": len(self.document_types),
-            "tags": len(self.tags),
-            "storage_paths": len(self.storage_paths),
-            "custom_fields": len(self.custom_fields),
-        }
+        """Gibt die Anzahl gecachter Einträge pro Kategorie zurück.
+
+        Das dict wird bis zur nächsten Änderung wiederverwendet –
+        Aufrufer dürfen es nicht verändern.
+        """
+        if self._stats is None:
+            self._stats = {
+                "correspondents": len(self.correspondents),
+                "document_types": len(self.document_types),
+                "tags": len(self.tags),
+                "storage_paths": len(self.storage_paths),
+                "custom_fields": len(self.custom_fields),
+            }
+        return self._stats
@@ -16,14 +16,23 @@ Siehe: Design-Dokument Abschnitt 4, ERRATA E-001/E-002
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, TypeVar
 
 import httpx
+import orjson
+from pydantic import BaseModel, TypeAdapter
 from tenacity import (
+    RetryCallState,
     retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_exponential_jitter,
 )
 
 from app.logging_config import get_logger
@@ -33,6 +42,7 @@ from app.paperless.exceptions import (
     PaperlessConnectionError,
     PaperlessError,
     PaperlessNotFoundError,
+    PaperlessRateLimitError,
     PaperlessServerError,
     PaperlessValidationError,
 )
@@ -42,16 +52,46 @@ from app.paperless.models import (
     CustomFieldValue,
     Document,
     DocumentType,
-    PaginatedResponse,
     StoragePath,
     Tag,
 )
 
 logger = get_logger("paperless")
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+# Content-Type für mit orjson kodierte Request-Bodies
+_JSON_CONTENT_HEADERS = {"Content-Type": "application/json"}
+
+# Listen-Validatoren: ein Validator-Aufruf pro Ergebnisliste statt
+# model_validate() pro Eintrag
+_DOCUMENT_LIST = TypeAdapter(list[Document])
+_CORRESPONDENT_LIST = TypeAdapter(list[Correspondent])
+_DOCUMENT_TYPE_LIST = TypeAdapter(list[DocumentType])
+_TAG_LIST = TypeAdapter(list[Tag])
+_STORAGE_PATH_LIST = TypeAdapter(list[StoragePath])
+_CUSTOM_FIELD_LIST = TypeAdapter(list[CustomFieldDefinition])
+
 # Maximale Seiten beim automatischen Paging (Schutz vor Endlosschleifen)
 MAX_PAGES = 50
 
+# Gleichzeitig abgerufene Seiten beim Paging (schont Paperless und den Pool)
+PAGE_FETCH_CONCURRENCY = 4
+
+# Gleichzeitige POSTs bei Sammel-Neuanlagen (_create_many)
+CREATE_CONCURRENCY = 4
+
+# Ab so vielen Dokumenten läuft die Listen-Validierung in einem
+# Worker-Thread, damit der Event-Loop währenddessen ansprechbar bleibt
+THREADED_VALIDATION_MIN_DOCUMENTS = 200
+
+# Wie lange ein zuletzt gelesenes/geschriebenes Dokument für
+# Read-Modify-Write-Operationen (Tags, Custom Fields) als aktuell gilt
+DOCUMENT_CACHE_TTL_SECONDS = 5.0
+
+# Ab dieser Größe werden abgelaufene Einträge aus dem Dokument-Cache entfernt
+DOCUMENT_CACHE_PRUNE_SIZE = 64
+
 # Timeout-Konfiguration
 DEFAULT_TIMEOUT = httpx.Timeout(
     connect=10.0,    # Verbindungsaufbau
@@ -60,6 +100,23 @@ DEFAULT_TIMEOUT = httpx.Timeout(
     pool=10.0,       # Auf freie Connection warten
 )
 
+# Connection-Pool: Keep-Alive-Verbindungen bleiben zwischen Polling-Zyklen
+# und parallelen Abrufen (load_cache, Pagination) erhalten
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# Versuche pro Request bei transienten Fehlern (5xx, Netzwerk)
+MAX_REQUEST_ATTEMPTS = 3
+
+# Obergrenze für eine per Retry-After vorgegebene Wartezeit (Sekunden)
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+# Blockgröße beim gestreamten PDF-Download
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 # Timeout speziell für PDF-Downloads (große Dateien)
 DOWNLOAD_TIMEOUT = httpx.Timeout(
     connect=10.0,
@@ -69,6 +126,82 @@ DOWNLOAD_TIMEOUT = httpx.Timeout(
 )
 
 
+def create_http_client(
+    base_url: str,
+    token: str,
+    **kwargs: Any,
+) -> httpx.AsyncClient:
+    """Erstellt einen httpx AsyncClient mit Paperless-Auth und API-Version.
+
+    Wird sowohl vom PaperlessClient selbst als auch von main.py genutzt,
+    um einen gemeinsamen Connection-Pool für Health-Check und API-Zugriffe
+    aufzubauen.
+
+    HTTP/2 ist standardmäßig aktiv (parallele Requests teilen sich eine
+    Verbindung); ohne installiertes h2-Paket wird auf HTTP/1.1 zurückgefallen.
+
+    Args:
+        base_url: Paperless-URL ohne Trailing-Slash
+        token: API-Token aus Paperless
+        **kwargs: Weitere Argumente für httpx.AsyncClient (timeout, limits, http2, ...)
+
+    Returns:
+        Konfigurierter, noch nicht geschlossener httpx.AsyncClient
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    kwargs.setdefault("limits", DEFAULT_LIMITS)
+    kwargs.setdefault("follow_redirects", True)
+    kwargs.setdefault("http2", True)
+    headers = {
+        "Authorization": f"Token {token}",
+        "Accept": "application/json; version=7",
+    }
+    try:
+        return httpx.AsyncClient(base_url=base_url.rstrip("/"), headers=headers, **kwargs)
+    except ImportError:
+        if not kwargs.get("http2"):
+            raise
+        logger.warning("h2 nicht installiert – Paperless-Client nutzt HTTP/1.1")
+        kwargs["http2"] = False
+        return httpx.AsyncClient(base_url=base_url.rstrip("/"), headers=headers, **kwargs)
+
+
+def _parse_retry_after(response: httpx.Response) -> float | None:
+    """Liest den Retry-After-Header (Sekunden oder HTTP-Datum).
+
+    Returns:
+        Wartezeit in Sekunden (höchstens MAX_RETRY_AFTER_SECONDS) oder
+        None wenn der Header fehlt bzw. nicht lesbar ist.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+# Exponentielles Backoff mit Jitter: nach einem Paperless-Neustart
+# wiederholen parallele Requests nicht alle im selben Takt
+_backoff_wait = wait_exponential_jitter(initial=1, max=10, jitter=1)
+
+
+def _wait_retry_after_or_backoff(retry_state: RetryCallState) -> float:
+    """Wartezeit vor dem nächsten Versuch: Retry-After des Servers, sonst Backoff."""
+    outcome = retry_state.outcome
+    exc = outcome.exception() if outcome is not None else None
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        return retry_after
+    return _backoff_wait(retry_state)
+
+
 class PaperlessClient:
     """Asynchroner Client für die Paperless-ngx REST API.
 
@@ -79,37 +212,47 @@ class PaperlessClient:
             pdf = await client.get_document_content(docs[0].id)
 
     Der Client verwaltet einen internen httpx.AsyncClient mit Connection-Pooling
-    und einen LookupCache für Stammdaten.
+    und einen LookupCache für Stammdaten.  Alternativ kann ein bereits
+    konfigurierter Client (siehe create_http_client) übergeben werden –
+    dieser wird dann nicht vom PaperlessClient geschlossen.
     """
 
-    def __init__(self, base_url: str, token: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        client: httpx.AsyncClient | None = None,
+        cache_path: Path | None = None,
+    ) -> None:
         """Initialisiert den Client.
 
         Args:
             base_url: Paperless-URL ohne Trailing-Slash (z.B. "http://192.168.178.73:8000")
             token: API-Token aus Paperless
+            client: Optionaler, extern verwalteter httpx Client (gemeinsamer
+                Connection-Pool).  Muss Auth-Header und base_url bereits
+                gesetzt haben.
+            cache_path: Optionale Datei für den persistierten Stammdaten-Cache.
+                Wird nach jedem erfolgreichen load_cache() aktualisiert.
         """
         self.base_url = base_url.rstrip("/")
         self._token = token
-        self._http: httpx.AsyncClient | None = None
+        self._http: httpx.AsyncClient | None = client
+        self._owns_http = client is None
+        self._cache_path = cache_path
         self.cache = LookupCache()
+        # Dokument-ID → (time.monotonic() beim Speichern, Dokument)
+        self._doc_cache: dict[int, tuple[float, Document]] = {}
 
     async def __aenter__(self) -> PaperlessClient:
         """Erstellt den httpx AsyncClient beim Betreten des Context-Managers."""
-        self._http = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers={
-                "Authorization": f"Token {self._token}",
-                "Accept": "application/json; version=7",
-            },
-            timeout=DEFAULT_TIMEOUT,
-            follow_redirects=True,
-        )
+        if self._owns_http:
+            self._http = create_http_client(self.base_url, self._token)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Schließt den httpx AsyncClient."""
-        if self._http is not None:
+        """Schließt den httpx AsyncClient (nur wenn selbst erstellt)."""
+        if self._owns_http and self._http is not None:
             await self._http.aclose()
             self._http = None
 
@@ -165,10 +308,17 @@ class PaperlessClient:
                 f"Ungültige Anfrage (HTTP 400): {detail}",
                 details=detail if isinstance(detail, dict) else {},
             )
+        if status == 429:
+            raise PaperlessRateLimitError(
+                f"Zu viele Anfragen (HTTP 429): {detail}",
+                status_code=status,
+                retry_after=_parse_retry_after(response),
+            )
         if status >= 500:
             raise PaperlessServerError(
                 f"Serverfehler (HTTP {status}): {detail}",
                 status_code=status,
+                retry_after=_parse_retry_after(response) if status == 503 else None,
             )
         raise PaperlessError(
             f"Unerwarteter HTTP-Status {status}: {detail}",
@@ -176,9 +326,11 @@ class PaperlessClient:
         )
 
     @retry(
-        retry=retry_if_exception_type((PaperlessServerError, PaperlessConnectionError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_exception_type(
+            (PaperlessServerError, PaperlessConnectionError, PaperlessRateLimitError)
+        ),
+        stop=stop_after_attempt(MAX_REQUEST_ATTEMPTS),
+        wait=_wait_retry_after_or_backoff,
         reraise=True,
     )
     async def _request(
@@ -207,13 +359,22 @@ class PaperlessClient:
             PaperlessAuthError: Bei 401/403
             PaperlessServerError: Bei 5xx (nach Retries)
         """
+        # Body selbst mit orjson kodieren statt über httpx' json-Parameter
+        content: bytes | None = None
+        headers: dict[str, str] | None = None
+        if json_data is not None:
+            content = orjson.dumps(json_data)
+            headers = _JSON_CONTENT_HEADERS
+
         try:
             response = await self.http.request(
                 method,
                 path,
                 params=params,
-                json=json_data,
-                timeout=timeout,
+                content=content,
+                headers=headers,
+                # Explizit setzen: ein gemeinsamer Client hat kürzere Defaults
+                timeout=timeout if timeout is not None else DEFAULT_TIMEOUT,
             )
         except httpx.TimeoutException as e:
             raise PaperlessConnectionError(
@@ -227,6 +388,55 @@ class PaperlessClient:
         self._raise_for_status(response)
         return response
 
+    @retry(
+        retry=retry_if_exception_type(
+            (PaperlessServerError, PaperlessConnectionError, PaperlessRateLimitError)
+        ),
+        stop=stop_after_attempt(MAX_REQUEST_ATTEMPTS),
+        wait=_wait_retry_after_or_backoff,
+        reraise=True,
+    )
+    async def _open_stream(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        timeout: httpx.Timeout | None = None,
+    ) -> httpx.Response:
+        """Öffnet einen GET-Request im Streaming-Modus (Retry bis zu den Headern).
+
+        Der Retry greift nur, bis Status und Header da sind – der Body wird
+        vom Aufrufer gelesen, der die Response auch schließen muss.
+
+        Returns:
+            Geöffnete httpx Response mit erfolgreichem Status
+
+        Raises:
+            PaperlessConnectionError: Bei Netzwerkfehlern
+            PaperlessServerError: Bei 5xx (nach Retries)
+        """
+        request = self.http.build_request(
+            "GET",
+            path,
+            params=params,
+            timeout=timeout if timeout is not None else DEFAULT_TIMEOUT,
+        )
+        try:
+            response = await self.http.send(request, stream=True)
+        except httpx.TimeoutException as e:
+            raise PaperlessConnectionError(f"Timeout bei GET {path}: {e}") from e
+        except httpx.RequestError as e:
+            raise PaperlessConnectionError(f"Verbindungsfehler bei GET {path}: {e}") from e
+
+        if not response.is_success:
+            # Fehler-Body (klein) für die Meldung lesen, dann freigeben
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            self._raise_for_status(response)
+        return response
+
     async def _get_json(
         self,
         path: str,
@@ -234,68 +444,86 @@ class PaperlessClient:
     ) -> dict[str, Any]:
         """GET-Request mit JSON-Response."""
         response = await self._request("GET", path, params=params)
-        return response.json()
+        return orjson.loads(response.content)
 
     async def _get_paginated_all(
         self,
         path: str,
         params: dict[str, Any] | None = None,
+        max_items: int | None = None,
     ) -> list[dict[str, Any]]:
         """Holt alle Seiten eines paginierten Endpoints.
 
-        Folgt automatisch dem 'next'-Link bis alle Ergebnisse geladen sind.
-        Schutz gegen Endlosschleifen durch MAX_PAGES.
+        Die erste Seite liefert die Gesamtanzahl ('count'); alle weiteren
+        Seiten werden dann über den 'page'-Parameter parallel abgerufen
+        (höchstens PAGE_FETCH_CONCURRENCY gleichzeitig).  Schutz gegen
+        Endlosschleifen durch MAX_PAGES.
 
         Args:
             path: API-Pfad (z.B. "/api/tags/")
             params: Initiale Query-Parameter
+            max_items: Höchstens so viele Ergebnisse; es werden nur die
+                dafür nötigen Seiten abgerufen.  None = alle.
 
         Returns:
-            Alle results über alle Seiten zusammengeführt
+            Alle results über alle Seiten zusammengeführt (in Seitenreihenfolge)
         """
-        all_results: list[dict[str, Any]] = []
-        current_params = dict(params or {})
-        pages_fetched = 0
-
-        while pages_fetched < MAX_PAGES:
-            data = await self._get_json(path, params=current_params)
-            page = PaginatedResponse.model_validate(data)
-            all_results.extend(page.results)
-            pages_fetched += 1
-
-            if page.next is None:
-                break
-
-            # 'next' ist eine vollständige URL – wir extrahieren die Query-Parameter
-            next_url = httpx.URL(page.next)
-            current_params = dict(next_url.params)
-            # Pfad könnte sich unterscheiden (absolute URL), wir bleiben beim Original-Pfad
-        else:
+        base_params = dict(params or {})
+        # Rohes dict statt PaginatedResponse: gebraucht werden nur count,
+        # next und results – 'all' (alle IDs) muss nicht validiert werden
+        data = await self._get_json(path, params=base_params)
+        all_results: list[dict[str, Any]] = data.get("results") or []
+
+        if max_items is not None and len(all_results) >= max_items:
+            return all_results[:max_items]
+        if data.get("next") is None or not all_results:
+            return all_results
+
+        page_size = len(all_results)
+        total_pages = -(-int(data["count"]) // page_size)  # Aufrunden
+        if max_items is not None:
+            # Gewolltes Limit, daher ohne MAX_PAGES-Warnung
+            total_pages = min(total_pages, -(-max_items // page_size))
+        if total_pages > MAX_PAGES:
             logger.warning(
                 "Pagination-Limit (%d Seiten) erreicht für %s – Ergebnisse unvollständig",
                 MAX_PAGES,
                 path,
             )
+            total_pages = MAX_PAGES
+
+        semaphore = asyncio.Semaphore(PAGE_FETCH_CONCURRENCY)
 
+        async def fetch_page(page_number: int) -> list[dict[str, Any]]:
+            async with semaphore:
+                page_data = await self._get_json(
+                    path, params={**base_params, "page": page_number},
+                )
+            return page_data.get("results") or []
+
+        pages = await asyncio.gather(
+            *(fetch_page(number) for number in range(2, total_pages + 1))
+        )
+        for results in pages:
+            all_results.extend(results)
+        if max_items is not None:
+            return all_results[:max_items]
         return all_results
 
-    async def _post_json(
+    async def _request_model(
         self,
+        method: str,
         path: str,
-        data: dict[str, Any],
-    ) -> dict[str, Any]:
-        """POST-Request mit JSON-Body und JSON-Response."""
-        response = await self._request("POST", path, json_data=data)
-        return response.json()
+        model: type[_ModelT],
+        data: dict[str, Any] | None = None,
+    ) -> _ModelT:
+        """Request mit optionalem JSON-Body, Antwort direkt als Pydantic-Modell.
 
-    async def _patch_json(
-        self,
-        path: str,
-        data: dict[str, Any],
-    ) -> dict[str, Any]:
-        """PATCH-Request mit JSON-Body und JSON-Response."""
-        response = await self._request("PATCH", path, json_data=data)
-        return response.json()
+        model_validate_json() parst die Response-Bytes im Pydantic-Core,
+        ohne Umweg über ein Python-dict.
+        """
+        response = await self._request(method, path, json_data=data)
+        return model.model_validate_json(response.content)
 
     # =========================================================================
     # Dokument-Operationen
@@ -312,6 +540,8 @@ class PaperlessClient:
         ordering: str = "-added",
         query: str | None = None,
         page_size: int = 100,
+        fields: Sequence[str] | None = None,
+        limit: int | None = None,
     ) -> list[Document]:
         """Dokumente abrufen mit optionalen Filtern.
 
@@ -325,10 +555,18 @@ class PaperlessClient:
             ordering: Sortierung (z.B. "-added" für neueste zuerst)
             query: Volltextsuche
             page_size: Ergebnisse pro Seite (max. 100)
+            fields: Projektion auf die angegebenen API-Felder (Paperless
+                ``fields=``).  Nicht gelieferte Felder behalten die
+                Modell-Defaults – insbesondere ``content`` (OCR-Text) ist
+                dann leer.  None = vollständige Darstellung.
+            limit: Höchstens so viele Dokumente (in Sortierreihenfolge);
+                Folgeseiten werden nur bei Bedarf abgerufen.  None = alle.
 
         Returns:
             Liste von Document-Objekten
         """
+        if limit is not None:
+            page_size = min(page_size, limit)
         params: dict[str, Any] = {
             "ordering": ordering,
             "page_size": min(page_size, 100),
@@ -347,9 +585,18 @@ class PaperlessClient:
             params["custom_field_query"] = custom_field_query
         if query is not None:
             params["query"] = query
+        if fields:
+            # "id" immer mitliefern – einziges Pflichtfeld im Document-Modell
+            params["fields"] = ",".join(dict.fromkeys(("id", *fields)))
 
-        raw_results = await self._get_paginated_all("/api/documents/", params=params)
-        return [Document.model_validate(r) for r in raw_results]
+        raw_results = await self._get_paginated_all(
+            "/api/documents/", params=params, max_items=limit,
+        )
+        if len(raw_results) >= THREADED_VALIDATION_MIN_DOCUMENTS:
+            # Große Listen (inkl. OCR-Text) blockieren sonst den Loop
+            # spürbar; kleine validieren ohne Thread-Wechsel schneller
+            return await asyncio.to_thread(_DOCUMENT_LIST.validate_python, raw_results)
+        return _DOCUMENT_LIST.validate_python(raw_results)
 
     async def get_document(self, doc_id: int) -> Document:
         """Einzelnes Dokument mit allen Metadaten abrufen.
@@ -364,12 +611,12 @@ class PaperlessClient:
             PaperlessNotFoundError: Wenn Dokument nicht existiert
         """
         try:
-            data = await self._get_json(f"/api/documents/{doc_id}/")
+            doc = await self._request_model("GET", f"/api/documents/{doc_id}/", Document)
         except PaperlessError as e:
             if e.status_code == 404:
                 raise PaperlessNotFoundError("Dokument", doc_id) from e
             raise
-        return Document.model_validate(data)
+        return self._remember_document(doc)
 
     async def get_document_content(self, doc_id: int, *, original: bool = False) -> bytes:
         """Original-PDF eines Dokuments herunterladen.
@@ -384,22 +631,58 @@ class PaperlessClient:
         Raises:
             PaperlessNotFoundError: Wenn Dokument nicht existiert
         """
+        return b"".join([
+            chunk
+            async for chunk in self.stream_document_content(doc_id, original=original)
+        ])
+
+    async def stream_document_content(
+        self,
+        doc_id: int,
+        *,
+        original: bool = False,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """PDF eines Dokuments stückweise herunterladen.
+
+        Für Verbraucher, die das PDF nicht erst komplett im Speicher
+        brauchen (z.B. Abbruch bei Überschreiten einer Größengrenze).
+        Transiente Fehler werden nur beim Öffnen wiederholt: ein Abbruch
+        mitten im Body würde sonst doppelte Chunks liefern.
+
+        Args:
+            doc_id: Paperless Dokument-ID
+            original: True für das unverarbeitete Original (nicht PDF/A-konvertiert)
+            chunk_size: Größe der gelieferten Blöcke in Bytes
+
+        Yields:
+            PDF-Daten in Blöcken
+
+        Raises:
+            PaperlessNotFoundError: Wenn Dokument nicht existiert
+            PaperlessConnectionError: Bei Netzwerkfehlern
+        """
         path = f"/api/documents/{doc_id}/download/"
         params = {"original": "true"} if original else None
 
         try:
-            response = await self._request(
-                "GET",
-                path,
-                params=params,
-                timeout=DOWNLOAD_TIMEOUT,
+            response = await self._open_stream(
+                path, params=params, timeout=DOWNLOAD_TIMEOUT,
             )
         except PaperlessError as e:
             if e.status_code == 404:
                 raise PaperlessNotFoundError("Dokument", doc_id) from e
             raise
 
-        return response.content
+        try:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+        except httpx.TimeoutException as e:
+            raise PaperlessConnectionError(f"Timeout bei GET {path}: {e}") from e
+        except httpx.RequestError as e:
+            raise PaperlessConnectionError(f"Verbindungsfehler bei GET {path}: {e}") from e
+        finally:
+            await response.aclose()
 
     async def get_document_thumbnail(self, doc_id: int) -> bytes:
         """Thumbnail eines Dokuments herunterladen (für Web-UI).
@@ -436,17 +719,102 @@ class PaperlessClient:
             PaperlessValidationError: Wenn Felder ungültig sind
         """
         try:
-            data = await self._patch_json(f"/api/documents/{doc_id}/", fields)
+            doc = await self._request_model(
+                "PATCH", f"/api/documents/{doc_id}/", Document, fields,
+            )
         except PaperlessError as e:
+            # Stand nach fehlgeschlagenem PATCH unklar → nicht weiterverwenden
+            self.invalidate_document(doc_id)
             if e.status_code == 404:
                 raise PaperlessNotFoundError("Dokument", doc_id) from e
             raise
-        return Document.model_validate(data)
+        return self._remember_document(doc)
+
+    # =========================================================================
+    # Dokument-Cache für Read-Modify-Write
+    # =========================================================================
+
+    def _remember_document(self, doc: Document) -> Document:
+        """Merkt sich den zuletzt gesehenen Stand eines Dokuments."""
+        now = time.monotonic()
+        if len(self._doc_cache) >= DOCUMENT_CACHE_PRUNE_SIZE:
+            self._doc_cache = {
+                doc_id: entry
+                for doc_id, entry in self._doc_cache.items()
+                if now - entry[0] < DOCUMENT_CACHE_TTL_SECONDS
+            }
+        self._doc_cache[doc.id] = (now, doc)
+        return doc
+
+    def invalidate_document(self, doc_id: int) -> None:
+        """Verwirft den gemerkten Stand eines Dokuments."""
+        self._doc_cache.pop(doc_id, None)
+
+    async def _get_document_for_update(self, doc_id: int) -> Document:
+        """Aktueller Stand eines Dokuments als Basis für eine Änderung.
+
+        Nutzt das zuletzt gelesene oder geschriebene Dokument, wenn es
+        jünger als DOCUMENT_CACHE_TTL_SECONDS ist – typischerweise direkt
+        nach update_document() in der Pipeline.  Spart den GET vor dem PATCH.
+        """
+        entry = self._doc_cache.get(doc_id)
+        if entry is not None and time.monotonic() - entry[0] < DOCUMENT_CACHE_TTL_SECONDS:
+            return entry[1]
+        return await self.get_document(doc_id)
 
     # =========================================================================
     # Custom Field Operationen
     # =========================================================================
 
+    async def set_custom_fields(
+        self,
+        doc_id: int,
+        updates: dict[int, Any],
+        removals: Iterable[int] = (),
+    ) -> Document:
+        """Setzt und entfernt mehrere Custom Fields mit einem einzigen PATCH.
+
+        Die Custom Fields des Dokuments werden einmal geladen, als
+        field_id→value-Mapping zusammengeführt (erst removals, dann
+        updates) und gemeinsam zurückgeschrieben.  Nicht genannte Felder
+        bleiben erhalten.  Ändert sich nichts, entfällt der PATCH.
+
+        Für Select-Felder gilt wie bei set_custom_field: 'value' ist die
+        interne Option-ID (ERRATA E-001).
+
+        Args:
+            doc_id: Paperless Dokument-ID
+            updates: field_id → neuer Wert
+            removals: IDs der Felder, die entfernt werden sollen
+
+        Returns:
+            Aktualisiertes Document-Objekt
+        """
+        # Aktuelle Custom Fields laden, um andere Felder nicht zu verlieren
+        doc = await self._get_document_for_update(doc_id)
+        # Bei doppelten Einträgen gilt wie in get_custom_field_value() der erste
+        current = doc.custom_field_values()
+        merged = dict(current)
+        for field_id in removals:
+            merged.pop(field_id, None)
+        merged.update(updates)
+
+        # Dict-Vergleich prüft Schlüssel und Werte (Reihenfolge egal)
+        if merged == current:
+            logger.debug(
+                "Custom Fields an Dokument %d unverändert, überspringe",
+                doc_id,
+            )
+            return doc
+
+        return await self.update_document(
+            doc_id,
+            custom_fields=[
+                {"field": field_id, "value": value}
+                for field_id, value in merged.items()
+            ],
+        )
+
     async def set_custom_field(
         self,
         doc_id: int,
@@ -470,16 +838,7 @@ class PaperlessClient:
         Returns:
             Aktualisiertes Document-Objekt
         """
-        # Aktuelle Custom Fields laden, um andere Felder nicht zu verlieren
-        doc = await self.get_document(doc_id)
-        existing_fields = [
-            {"field": cf.field, "value": cf.value}
-            for cf in doc.custom_fields
-            if cf.field != field_id  # Bestehendes Feld ersetzen
-        ]
-        existing_fields.append({"field": field_id, "value": value})
-
-        return await self.update_document(doc_id, custom_fields=existing_fields)
+        return await self.set_custom_fields(doc_id, {field_id: value})
 
     async def set_custom_field_by_label(
         self,
@@ -519,13 +878,7 @@ class PaperlessClient:
         Returns:
             Aktualisiertes Document-Objekt
         """
-        doc = await self.get_document(doc_id)
-        remaining_fields = [
-            {"field": cf.field, "value": cf.value}
-            for cf in doc.custom_fields
-            if cf.field != field_id
-        ]
-        return await self.update_document(doc_id, custom_fields=remaining_fields)
+        return await self.set_custom_fields(doc_id, {}, removals=(field_id,))
 
     # =========================================================================
     # Tag-Operationen
@@ -541,8 +894,8 @@ class PaperlessClient:
         Returns:
             Aktualisiertes Document-Objekt
         """
-        doc = await self.get_document(doc_id)
-        if tag_id in doc.tags:
+        doc = await self._get_document_for_update(doc_id)
+        if doc.has_tag(tag_id):
             logger.debug("Tag %d bereits an Dokument %d vorhanden, überspringe", tag_id, doc_id)
             return doc
         new_tags = doc.tags + [tag_id]
@@ -558,8 +911,8 @@ class PaperlessClient:
         Returns:
             Aktualisiertes Document-Objekt (unverändert wenn Tag nicht vorhanden)
         """
-        doc = await self.get_document(doc_id)
-        if tag_id not in doc.tags:
+        doc = await self._get_document_for_update(doc_id)
+        if not doc.has_tag(tag_id):
             logger.debug("Tag %d nicht an Dokument %d vorhanden, überspringe", tag_id, doc_id)
             return doc
         new_tags = [t for t in doc.tags if t != tag_id]
@@ -572,27 +925,27 @@ class PaperlessClient:
     async def get_correspondents(self) -> list[Correspondent]:
         """Alle Korrespondenten abrufen (paginiert)."""
         raw = await self._get_paginated_all("/api/correspondents/")
-        return [Correspondent.model_validate(r) for r in raw]
+        return _CORRESPONDENT_LIST.validate_python(raw)
 
     async def get_document_types(self) -> list[DocumentType]:
         """Alle Dokumenttypen abrufen (paginiert)."""
         raw = await self._get_paginated_all("/api/document_types/")
-        return [DocumentType.model_validate(r) for r in raw]
+        return _DOCUMENT_TYPE_LIST.validate_python(raw)
 
     async def get_tags(self) -> list[Tag]:
         """Alle Tags abrufen (paginiert)."""
         raw = await self._get_paginated_all("/api/tags/")
-        return [Tag.model_validate(r) for r in raw]
+        return _TAG_LIST.validate_python(raw)
 
     async def get_storage_paths(self) -> list[StoragePath]:
         """Alle Speicherpfade abrufen (paginiert)."""
         raw = await self._get_paginated_all("/api/storage_paths/")
-        return [StoragePath.model_validate(r) for r in raw]
+        return _STORAGE_PATH_LIST.validate_python(raw)
 
     async def get_custom_fields(self) -> list[CustomFieldDefinition]:
         """Alle Custom-Field-Definitionen abrufen (paginiert)."""
         raw = await self._get_paginated_all("/api/custom_fields/")
-        return [CustomFieldDefinition.model_validate(r) for r in raw]
+        return _CUSTOM_FIELD_LIST.validate_python(raw)
 
     # =========================================================================
     # Stammdaten: Erstellen
@@ -609,8 +962,7 @@ class PaperlessClient:
             Angelegter Correspondent mit ID
         """
         payload = {"name": name, **kwargs}
-        data = await self._post_json("/api/correspondents/", payload)
-        result = Correspondent.model_validate(data)
+        result = await self._request_model("POST", "/api/correspondents/", Correspondent, payload)
         self.cache.add_correspondent(result)
         logger.info("Korrespondent angelegt: '%s' (ID %d)", result.name, result.id)
         return result
@@ -626,8 +978,7 @@ class PaperlessClient:
             Angelegter DocumentType mit ID
         """
         payload = {"name": name, **kwargs}
-        data = await self._post_json("/api/document_types/", payload)
-        result = DocumentType.model_validate(data)
+        result = await self._request_model("POST", "/api/document_types/", DocumentType, payload)
         self.cache.add_document_type(result)
         logger.info("Dokumenttyp angelegt: '%s' (ID %d)", result.name, result.id)
         return result
@@ -643,8 +994,7 @@ class PaperlessClient:
             Angelegter Tag mit ID
         """
         payload = {"name": name, **kwargs}
-        data = await self._post_json("/api/tags/", payload)
-        result = Tag.model_validate(data)
+        result = await self._request_model("POST", "/api/tags/", Tag, payload)
         self.cache.add_tag(result)
         logger.info("Tag angelegt: '%s' (ID %d)", result.name, result.id)
         return result
@@ -666,12 +1016,74 @@ class PaperlessClient:
             Angelegter StoragePath mit ID
         """
         payload = {"name": name, "path": path, **kwargs}
-        data = await self._post_json("/api/storage_paths/", payload)
-        result = StoragePath.model_validate(data)
+        result = await self._request_model("POST", "/api/storage_paths/", StoragePath, payload)
         self.cache.add_storage_path(result)
         logger.info("Speicherpfad angelegt: '%s' (ID %d)", result.name, result.id)
         return result
 
+    async def _create_many(
+        self,
+        path: str,
+        model: type[_ModelT],
+        specs: Sequence[dict[str, Any]],
+        add_to_cache: Callable[[_ModelT], None],
+        label: str,
+    ) -> list[_ModelT]:
+        """Legt mehrere Einträge parallel an (höchstens CREATE_CONCURRENCY POSTs).
+
+        Einzelne Paperless-Fehler werden geloggt und übersprungen, damit
+        die übrigen Einträge trotzdem angelegt und gecacht werden.  Andere
+        Exceptions werden weitergereicht – die erste davon, nachdem alle
+        erfolgreich angelegten Einträge gecacht sind.
+
+        Args:
+            path: Collection-Endpoint (z.B. "/api/tags/")
+            model: Pydantic-Modell der Antwort
+            specs: Ein Payload pro anzulegendem Eintrag (mindestens "name")
+            add_to_cache: LookupCache.add_*-Methode der Kategorie
+            label: Bezeichnung für Log-Meldungen (z.B. "Tag")
+
+        Returns:
+            Die erfolgreich angelegten Einträge in Reihenfolge von specs
+        """
+        semaphore = asyncio.Semaphore(CREATE_CONCURRENCY)
+
+        async def create(spec: dict[str, Any]) -> _ModelT:
+            async with semaphore:
+                return await self._request_model("POST", path, model, spec)
+
+        results = await asyncio.gather(
+            *(create(spec) for spec in specs), return_exceptions=True,
+        )
+
+        created: list[_ModelT] = []
+        unexpected: BaseException | None = None
+        for spec, result in zip(specs, results):
+            if isinstance(result, PaperlessError):
+                logger.warning(
+                    "%s '%s' konnte nicht angelegt werden: %s",
+                    label, spec.get("name"), result,
+                )
+                continue
+            if isinstance(result, BaseException):
+                # Erst nach der Schleife werfen – die übrigen POSTs sind
+                # bereits durch und müssen noch in den Cache
+                if unexpected is None:
+                    unexpected = result
+                continue
+            add_to_cache(result)
+            created.append(result)
+            logger.info("%s angelegt: '%s' (ID %d)", label, result.name, result.id)
+        if unexpected is not None:
+            raise unexpected
+        return created
+
+    async def create_many_tags(self, specs: Sequence[dict[str, Any]]) -> list[Tag]:
+        """Mehrere Tags parallel anlegen (siehe _create_many)."""
+        return await self._create_many(
+            "/api/tags/", Tag, specs, self.cache.add_tag, "Tag",
+        )
+
     # =========================================================================
     # Cache-Management
     # =========================================================================
@@ -681,17 +1093,28 @@ class PaperlessClient:
 
         Sollte beim Startup einmalig aufgerufen werden.
         Überschreibt bestehende Cache-Einträge komplett.
+        Die fünf Stammdaten-Endpoints werden parallel abgefragt.
 
         Returns:
             Dict mit Anzahl geladener Einträge pro Kategorie
         """
         logger.info("Lade Stammdaten-Cache...")
 
-        correspondents = await self.get_correspondents()
-        document_types = await self.get_document_types()
-        tags = await self.get_tags()
-        storage_paths = await self.get_storage_paths()
-        custom_fields = await self.get_custom_fields()
+        # Endpoints unabhängig voneinander → parallel abrufen (Folgeseiten
+        # lädt _get_paginated_all() pro Endpoint ebenfalls parallel)
+        (
+            correspondents,
+            document_types,
+            tags,
+            storage_paths,
+            custom_fields,
+        ) = await asyncio.gather(
+            self.get_correspondents(),
+            self.get_document_types(),
+            self.get_tags(),
+            self.get_storage_paths(),
+            self.get_custom_fields(),
+        )
 
         self.cache.set_correspondents(correspondents)
         self.cache.set_document_types(document_types)
@@ -709,8 +1132,33 @@ class PaperlessClient:
             stats["storage_paths"],
             stats["custom_fields"],
         )
+
+        if self._cache_path is not None:
+            try:
+                await asyncio.to_thread(self.cache.save_to_file, self._cache_path)
+            except OSError as exc:
+                # Persistenz ist nur ein Warmstart-Beschleuniger
+                logger.warning("Cache-Datei konnte nicht geschrieben werden: %s", exc)
+
         return stats
 
+    async def load_cache_from_disk(self) -> dict[str, int] | None:
+        """Lädt den zuletzt persistierten Stammdaten-Cache (ohne Netzwerk).
+
+        Für den Warmstart: Der Cache ist sofort nutzbar, ein anschließendes
+        load_cache() aktualisiert ihn im Hintergrund (stale-while-revalidate).
+
+        Returns:
+            Dict mit Anzahl geladener Einträge pro Kategorie, oder None wenn
+            kein cache_path gesetzt oder die Datei nicht verwendbar ist.
+        """
+        if self._cache_path is None:
+            return None
+        if not await asyncio.to_thread(self.cache.load_from_file, self._cache_path):
+            return None
+        logger.info("Stammdaten-Cache aus %s geladen", self._cache_path)
+        return self.cache.stats()
+
     async def refresh_cache(self) -> dict[str, int]:
         """Cache komplett neu laden (Alias für load_cache).
 
@@ -7,6 +7,7 @@ Hierarchie:
     ├── PaperlessNotFoundError       – 404, Ressource existiert nicht
     ├── PaperlessValidationError     – 400, ungültige Daten gesendet
     ├── PaperlessServerError         – 5xx, serverseitiger Fehler
+    ├── PaperlessRateLimitError      – 429, zu viele Anfragen
     └── PaperlessCacheError          – Fehler beim Cache-Lookup (z.B. Name nicht gefunden)
 """
 
@@ -14,10 +15,23 @@ from __future__ import annotations
 
 
 class PaperlessError(Exception):
-    """Basisklasse für alle Paperless API Fehler."""
+    """Basisklasse für alle Paperless API Fehler.
 
-    def __init__(self, message: str, status_code: int | None = None) -> None:
+    retry_after: Vom Server per Retry-After-Header vorgegebene Wartezeit
+    in Sekunden (nur bei 429/503 gesetzt), wird von der Retry-Logik des
+    Clients beachtet.
+    """
+
+    retry_after: float | None = None
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
         self.status_code = status_code
+        self.retry_after = retry_after
         super().__init__(message)
 
 
@@ -56,13 +70,23 @@ class PaperlessServerError(PaperlessError):
     pass
 
 
+class PaperlessRateLimitError(PaperlessError):
+    """Zu viele Anfragen (429) – transient, nach retry_after erneut versuchen."""
+
+
 class PaperlessCacheError(PaperlessError):
     """Fehler bei Stammdaten-Lookup, z.B. Name nicht im Cache gefunden."""
 
     def __init__(self, entity_type: str, name: str) -> None:
         self.entity_type = entity_type
         self.name = name
-        super().__init__(
-            f"{entity_type} '{name}' nicht im Cache gefunden. "
+        self.status_code = None
+        # Meldung wird erst bei str() formatiert – Aufrufer, die den Fehler
+        # nur als "nicht gefunden" auswerten, zahlen keine Formatierung
+        Exception.__init__(self, entity_type, name)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.entity_type} '{self.name}' nicht im Cache gefunden. "
             f"Cache-Refresh nötig oder Neuanlage erforderlich."
         )
@@ -11,9 +11,10 @@ Siehe auch: ERRATA E-001 (Select-Options Format), E-002 (Custom Field IDs)
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # =============================================================================
@@ -128,7 +129,10 @@ class CustomFieldDefinition(BaseModel):
     extra_data: dict[str, Any] = {}
     document_count: int = 0
 
-    @property
+    # Abgeleitete Werte als cached_property: Definitionen werden nach dem
+    # Abruf nicht mehr verändert, die Optionen also nur einmal geparst
+
+    @cached_property
     def select_options(self) -> list[SelectOption]:
         """Gibt die Select-Optionen zurück (nur für Select-Felder).
 
@@ -138,12 +142,26 @@ class CustomFieldDefinition(BaseModel):
         """
         if self.data_type != "select":
             return []
-        raw_options = self.extra_data.get("select_options", [])
-        result = []
-        for opt in raw_options:
-            if isinstance(opt, dict) and "id" in opt and "label" in opt:
-                result.append(SelectOption(**opt))
-        return result
+        raw_options = self.extra_data.get("select_options")
+        if not raw_options:
+            return []
+        return [
+            SelectOption(**opt)
+            for opt in raw_options
+            if isinstance(opt, dict) and "id" in opt and "label" in opt
+        ]
+
+    # reversed(): bei Duplikaten gewinnt wie bisher der erste Treffer
+
+    @cached_property
+    def _label_to_id(self) -> dict[str, str]:
+        """Label → Option-ID."""
+        return {opt.label: opt.id for opt in reversed(self.select_options)}
+
+    @cached_property
+    def _id_to_label(self) -> dict[str, str]:
+        """Option-ID → Label."""
+        return {opt.id: opt.label for opt in reversed(self.select_options)}
 
     def get_option_id_by_label(self, label: str) -> str | None:
         """Findet die interne ID einer Select-Option anhand ihres Labels.
@@ -157,10 +175,7 @@ class CustomFieldDefinition(BaseModel):
         Returns:
             Die interne ID (z.B. "1IOdA6xDPBZuJdvD") oder None
         """
-        for opt in self.select_options:
-            if opt.label == label:
-                return opt.id
-        return None
+        return self._label_to_id.get(label)
 
     def get_option_label_by_id(self, option_id: str) -> str | None:
         """Findet den Label-String einer Select-Option anhand ihrer ID.
@@ -171,10 +186,7 @@ class CustomFieldDefinition(BaseModel):
         Returns:
             Der Label-String oder None
         """
-        for opt in self.select_options:
-            if opt.id == option_id:
-                return opt.label
-        return None
+        return self._id_to_label.get(option_id)
 
 
 # =============================================================================
@@ -215,7 +227,7 @@ class Document(BaseModel):
     correspondent: int | None = None
     document_type: int | None = None
     storage_path: int | None = None
-    tags: list[int] = []
+    tags: list[int] = Field(default_factory=list)
     created: datetime | None = None
     created_date: str | None = None  # "YYYY-MM-DD"
     modified: datetime | None = None
@@ -223,9 +235,18 @@ class Document(BaseModel):
     original_file_name: str = ""
     archived_file_name: str = ""
     page_count: int = 0
-    custom_fields: list[CustomFieldValue] = []
+    custom_fields: list[CustomFieldValue] = Field(default_factory=list)
     # Hinweis: notes, owner, permissions etc. werden nicht modelliert
 
+    def custom_field_values(self) -> dict[int, Any]:
+        """Gibt alle Custom Fields als Field-ID → Wert zurück.
+
+        Bei doppelten Einträgen gewinnt – wie bei get_custom_field_value() –
+        der erste.  Wird bei jedem Aufruf neu gebaut (kein Cache am
+        veränderlichen Modell).
+        """
+        return {cf.field: cf.value for cf in reversed(self.custom_fields)}
+
     def get_custom_field_value(self, field_id: int) -> Any | None:
         """Gibt den Wert eines Custom Fields zurück.
 
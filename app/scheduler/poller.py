@@ -16,6 +16,8 @@ Poller-Objekt ermöglicht – die UI selbst kommt in einem späteren AP.
 from __future__ import annotations
 
 import asyncio
+import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -35,10 +37,20 @@ if TYPE_CHECKING:
 
 logger = get_logger("scheduler")
 
-# Pause zwischen zwei aufeinanderfolgenden Dokumenten (Sekunden).
-# Verhindert Rate-Limit-Fehler bei Batch-Verarbeitung (z.B. initialer Import).
-# Im Normalbetrieb (1-3 Dokumente pro Zyklus) vernachlässigbar.
-DOCUMENT_DELAY_SECONDS = 2.0
+# Adaptive Pause zwischen zwei Dokumenten (Sekunden).  Startet bei MIN
+# (verhindert Bursts beim ersten Import) und wird bei Rate-Limits (429/529)
+# verdoppelt, höchstens bis MAX.  Nach DOCUMENT_DELAY_DECAY_AFTER
+# erfolgreichen Dokumenten in Folge halbiert sie sich wieder; unter MIN
+# fällt sie ganz weg, solange die API nicht drosselt.
+DOCUMENT_DELAY_MIN_SECONDS = 2.0
+DOCUMENT_DELAY_MAX_SECONDS = 30.0
+DOCUMENT_DELAY_BACKOFF_FACTOR = 2.0
+DOCUMENT_DELAY_DECAY_AFTER = 3
+
+# Mindestabstand zwischen zwei Schema-Trigger-Prüfungen (Sekunden).
+# Jede Prüfung liest aus SQLite; bei kurzen Polling-Intervallen reicht
+# das deutlich seltener – der Trigger hat ohnehin ≥24h Mindestabstand.
+SCHEMA_TRIGGER_CHECK_INTERVAL_SECONDS = 300.0
 
 
 # ---------------------------------------------------------------------------
@@ -53,7 +65,7 @@ class PollerState(str, Enum):
     PROCESSING = "processing" # Gerade bei der Verarbeitung eines Dokuments
 
 
-@dataclass
+@dataclass(slots=True)
 class PollerStatus:
     """Aktueller Status des Pollers für Dashboard und API.
 
@@ -117,6 +129,10 @@ class Poller:
         self._database = database
 
         self._task: asyncio.Task[None] | None = None
+
+        # Adaptive Pause zwischen Dokumenten (über Zyklen hinweg erhalten)
+        self._document_delay = DOCUMENT_DELAY_MIN_SECONDS
+        self._consecutive_successes = 0
         self._stop_event = asyncio.Event()
         self._pause_event = asyncio.Event()
         # Nicht gesetzt = nicht pausiert → Verarbeitung läuft
@@ -126,6 +142,8 @@ class Poller:
         self._schema_trigger: SchemaTrigger | None = None
         if database is not None:
             self._schema_trigger = SchemaTrigger(database, settings)
+        # time.monotonic() der letzten Trigger-Prüfung (None = noch nie)
+        self._schema_trigger_checked_at: float | None = None
 
         self.status = PollerStatus()
 
@@ -175,6 +193,7 @@ class Poller:
         logger.info("Poller wird gestoppt...")
         self._stop_event.set()
         # Falls pausiert: Pause aufheben, damit der Loop das Stop-Event sieht
+        # (_wait_for_resume_or_stop wartet nur auf das Pause-Event)
         self._pause_event.set()
 
         try:
@@ -262,15 +281,54 @@ class Poller:
 
         logger.info("Polling-Loop beendet")
 
+    def _back_off_document_delay(self) -> None:
+        """Vergrößert die Pause zwischen Dokumenten nach einem Rate-Limit."""
+        self._consecutive_successes = 0
+        self._document_delay = min(
+            DOCUMENT_DELAY_MAX_SECONDS,
+            max(
+                DOCUMENT_DELAY_MIN_SECONDS,
+                self._document_delay * DOCUMENT_DELAY_BACKOFF_FACTOR,
+            ),
+        )
+        logger.info(
+            "Pause zwischen Dokumenten erhöht auf %.1fs", self._document_delay,
+        )
+
+    def _relax_document_delay(self) -> None:
+        """Baut die Pause nach einer Erfolgsserie schrittweise wieder ab."""
+        if not self._document_delay:
+            return
+        self._consecutive_successes += 1
+        if self._consecutive_successes < DOCUMENT_DELAY_DECAY_AFTER:
+            return
+        self._consecutive_successes = 0
+        self._document_delay /= DOCUMENT_DELAY_BACKOFF_FACTOR
+        if self._document_delay < DOCUMENT_DELAY_MIN_SECONDS:
+            self._document_delay = 0.0
+        logger.debug(
+            "Pause zwischen Dokumenten reduziert auf %.1fs", self._document_delay,
+        )
+
     async def _process_pending_documents(self) -> None:
-        """Sucht und verarbeitet alle Dokumente mit Tag 'NEU'.
+        """Sucht und verarbeitet die ältesten Dokumente mit Tag 'NEU'.
+
+        Pro Durchlauf höchstens settings.poll_batch_size Dokumente, älteste
+        zuerst.  Verarbeitete Dokumente verlieren den NEU-Tag, der Rest
+        eines großen Rückstands folgt also in den nächsten Durchläufen.
 
         Sequenzielle Verarbeitung: ein Dokument nach dem anderen.
         Fehler bei einem Dokument werden geloggt, stoppen aber nicht den Loop.
         """
-        # Dokumente mit Tag "NEU" abrufen
+        # Dokumente mit Tag "NEU" abrufen – nur ID und Titel, den OCR-Text
+        # lädt die Pipeline pro Dokument ohnehin selbst
         try:
-            documents = await self._paperless.get_documents(tags=[TAG_NEU_ID])
+            documents = await self._paperless.get_documents(
+                tags=[TAG_NEU_ID],
+                ordering="added",
+                fields=("id", "title"),
+                limit=self._settings.poll_batch_size,
+            )
         except Exception as exc:
             logger.error("Fehler beim Abrufen neuer Dokumente: %s", exc)
             self.status.last_error = f"Abruf-Fehler: {exc}"
@@ -284,6 +342,13 @@ class Poller:
         logger.info("%d Dokument(e) mit Tag 'NEU' gefunden", len(documents))
 
         run_results: list[PipelineResult] = []
+        # Zyklus-Kennzahlen laufend mitzählen statt am Ende über run_results
+        processed = 0
+        errored = 0
+        total_cost = 0.0
+        # Das Kostenlimit hat _run_loop() direkt vor diesem Aufruf geprüft.
+        # Erneut nur, nachdem ein Dokument Kosten verursacht haben kann.
+        needs_cost_check = False
 
         for i, doc in enumerate(documents):
             # Vor jedem Dokument: Stop/Pause prüfen
@@ -295,40 +360,54 @@ class Poller:
             if self._stop_event.is_set():
                 break
 
-            # Kostenlimit vor jedem Dokument prüfen
-            if await self._is_cost_limit_reached():
+            # Kostenlimit vor jedem Dokument prüfen (SQLite-Abfrage)
+            if needs_cost_check and await self._is_cost_limit_reached():
                 logger.warning(
                     "Kostenlimit erreicht – verbleibende Dokumente werden übersprungen"
                 )
                 break
 
-            # Delay zwischen Dokumenten (nicht vor dem ersten)
-            if i > 0:
+            # Adaptive Pause zwischen Dokumenten (nicht vor dem ersten):
+            # wächst bei Rate-Limits, sinkt nach DOCUMENT_DELAY_DECAY_AFTER
+            # Erfolgen in Folge und entfällt unterhalb des Minimums ganz
+            if i > 0 and self._document_delay:
                 logger.debug(
-                    "Warte %.1fs vor nächstem Dokument", DOCUMENT_DELAY_SECONDS,
+                    "Warte %.1fs vor nächstem Dokument", self._document_delay,
                 )
-                await asyncio.sleep(DOCUMENT_DELAY_SECONDS)
+                await asyncio.sleep(self._document_delay)
 
             # Dokument verarbeiten
             self.status.state = PollerState.PROCESSING
             self.status.current_document_id = doc.id
 
-            logger.info("Verarbeite Dokument %d: '%s'", doc.id, doc.title[:60])
+            # Argumente (Titel-Slice, Confidence) nur aufbereiten, wenn
+            # INFO tatsächlich ausgegeben wird
+            log_info = logger.isEnabledFor(logging.INFO)
+            if log_info:
+                logger.info("Verarbeite Dokument %d: '%s'", doc.id, doc.title[:60])
 
+            # Im Zweifel (Exception) vor dem nächsten Dokument neu prüfen
+            needs_cost_check = True
             try:
                 result = await self._pipeline.classify_document(doc.id)
                 run_results.append(result)
+                total_cost += result.cost_usd
+                needs_cost_check = result.cost_usd > 0
 
                 if result.success:
+                    processed += 1
                     self.status.documents_processed += 1
-                    logger.info(
-                        "Dokument %d erfolgreich: %s (%.1fs, $%.6f)",
-                        doc.id,
-                        result.confidence.level.value if result.confidence else "?",
-                        result.duration_seconds,
-                        result.cost_usd,
-                    )
+                    self._relax_document_delay()
+                    if log_info:
+                        logger.info(
+                            "Dokument %d erfolgreich: %s (%.1fs, $%.6f)",
+                            doc.id,
+                            result.confidence.level.value if result.confidence else "?",
+                            result.duration_seconds,
+                            result.cost_usd,
+                        )
                 else:
+                    errored += 1
                     self.status.documents_errored += 1
                     self.status.last_error = (
                         f"Dokument {doc.id}: {result.error}"
@@ -338,7 +417,8 @@ class Poller:
                     )
 
             except ClaudeAPIError as exc:
-                if exc.status_code in (429, 529):
+                if exc.is_rate_limited:
+                    self._back_off_document_delay()
                     # Rate-Limit oder Überlast: Zyklus abbrechen.
                     # Das Dokument wurde NICHT als Error markiert (Pipeline
                     # hat re-raised), NEU-Tag bleibt, ki_status bleibt null.
@@ -390,9 +470,6 @@ class Poller:
         if not self._stop_event.is_set() and self.status.state != PollerState.PAUSED:
             self.status.state = PollerState.RUNNING
 
-        processed = sum(1 for r in run_results if r.success)
-        errored = sum(1 for r in run_results if not r.success)
-        total_cost = sum(r.cost_usd for r in run_results)
         logger.info(
             "Zyklus abgeschlossen: %d verarbeitet, %d Fehler, $%.6f Kosten",
             processed, errored, total_cost,
@@ -444,24 +521,9 @@ class Poller:
 
         logger.debug("Poller pausiert – warte auf resume() oder stop()")
 
-        # Warten bis entweder Pause aufgehoben oder Stop signalisiert wird
-        stop_task = asyncio.create_task(self._stop_event.wait())
-        resume_task = asyncio.create_task(self._pause_event.wait())
-
-        try:
-            done, pending = await asyncio.wait(
-                {stop_task, resume_task},
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-        finally:
-            # Nicht abgeschlossene Tasks aufräumen
-            for task in (stop_task, resume_task):
-                if not task.done():
-                    task.cancel()
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
+        # stop() setzt ebenfalls das Pause-Event → ein einzelnes wait()
+        # deckt beide Fälle ab, ohne Hilfs-Tasks pro Pausengrenze
+        await self._pause_event.wait()
 
     async def _check_schema_trigger(self) -> None:
         """Prüft ob die Schema-Analyse ausgelöst werden soll.
@@ -470,11 +532,22 @@ class Poller:
         Nach erfolgreichem Lauf wird der Pipeline-Prompt-Cache invalidiert,
         damit die nächste Klassifizierung die neuen Schema-Regeln sieht.
 
+        Geprüft wird höchstens alle SCHEMA_TRIGGER_CHECK_INTERVAL_SECONDS,
+        nicht bei jedem Polling-Durchlauf.
+
         Fehler hier dürfen den Polling-Loop nicht unterbrechen.
         """
         if self._schema_trigger is None:
             return
 
+        now = time.monotonic()
+        if (
+            self._schema_trigger_checked_at is not None
+            and now - self._schema_trigger_checked_at < SCHEMA_TRIGGER_CHECK_INTERVAL_SECONDS
+        ):
+            return
+        self._schema_trigger_checked_at = now
+
         try:
             should_run, reason = await self._schema_trigger.should_run()
 
@@ -562,10 +635,12 @@ class Poller:
         Kann durch stop() vorzeitig abgebrochen werden.
         """
         interval = self._settings.polling_interval_seconds
-        self.status.next_run_at = datetime.now(timezone.utc).replace(
-            microsecond=0,
+        # Eigener Zeitstempel statt Zyklusbeginn: Verarbeitung und
+        # Schema-Analyse können Minuten dauern.  Sekundengenau für die Anzeige.
+        self.status.next_run_at = (
+            datetime.now(timezone.utc).replace(microsecond=0)
+            + timedelta(seconds=interval)
         )
-        self.status.next_run_at += timedelta(seconds=interval)
 
         logger.debug(
             "Nächster Zyklus in %ds (um %s)",
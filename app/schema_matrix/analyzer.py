@@ -16,13 +16,13 @@ AP-11: Schema-Analyse – Opus-Analyse & Prompt-Builder (Phase 3)
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 import time
 from typing import Any
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from app.claude.client import ClaudeClient, TextMessageResponse
 from app.claude.cost_tracker import TokenUsage
@@ -45,9 +45,20 @@ logger = logging.getLogger(__name__)
 # Pydantic-Modelle für die Opus-Antwort (Entscheidung 5)
 # ---------------------------------------------------------------------------
 
+# Gemeinsame Konfiguration: reine Lese-DTOs (frozen), zusätzliche Felder
+# von Opus werden ignoriert, Whitespace in Strings trimmt pydantic-core
+_OPUS_MODEL_CONFIG = ConfigDict(
+    extra="ignore",
+    frozen=True,
+    str_strip_whitespace=True,
+)
+
+
 class OpusTitleSchema(BaseModel):
     """Ein Titel-Schema aus der Opus-Antwort."""
 
+    model_config = _OPUS_MODEL_CONFIG
+
     document_type: str
     correspondent: str
     title_template: str = ""
@@ -62,6 +73,8 @@ class OpusTitleSchema(BaseModel):
 class OpusPathRule(BaseModel):
     """Eine Pfad-Regel aus der Opus-Antwort."""
 
+    model_config = _OPUS_MODEL_CONFIG
+
     topic: str
     rule_description: str = ""
     path_template: str = ""
@@ -74,6 +87,8 @@ class OpusPathRule(BaseModel):
 class OpusMappingEntry(BaseModel):
     """Eine Zuordnung aus der Opus-Antwort."""
 
+    model_config = _OPUS_MODEL_CONFIG
+
     correspondent: str
     document_type: str | None = None
     storage_path_name: str | None = None
@@ -86,6 +101,8 @@ class OpusMappingEntry(BaseModel):
 class OpusSuggestion(BaseModel):
     """Ein Verbesserungsvorschlag von Opus."""
 
+    model_config = _OPUS_MODEL_CONFIG
+
     category: str = "general"
     description: str = ""
     priority: str = "medium"
@@ -94,6 +111,8 @@ class OpusSuggestion(BaseModel):
 class OpusTagRuleItem(BaseModel):
     """Eine Tag-Zuordnungsregel aus der Opus-Antwort (AP-11b)."""
 
+    model_config = _OPUS_MODEL_CONFIG
+
     correspondent: str | None = None      # None/leer = gilt für alle
     document_type: str
     positive_tags: list[str] = Field(default_factory=list)
@@ -105,6 +124,8 @@ class OpusTagRuleItem(BaseModel):
 class OpusAnalysisResponse(BaseModel):
     """Vollständige validierte Opus-Antwort."""
 
+    model_config = _OPUS_MODEL_CONFIG
+
     title_schemas: list[OpusTitleSchema] = Field(default_factory=list)
     path_rules: list[OpusPathRule] = Field(default_factory=list)
     mapping_matrix: list[OpusMappingEntry] = Field(default_factory=list)
@@ -116,6 +137,9 @@ class OpusAnalysisResponse(BaseModel):
 # Opus-Prompt-Vorlage (aus Design-Dokument Abschnitt 8)
 # ---------------------------------------------------------------------------
 
+# Markdown-Codeblock um die JSON-Antwort (```json ... ```)
+_CODEBLOCK_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL)
+
 _SCHEMA_ANALYSIS_SYSTEM_PROMPT = """\
 Du analysierst die vollständige Organisationsstruktur eines Paperless-ngx \
 Dokumentenarchivs. Deine Aufgabe hat vier Teile.
@@ -214,6 +238,41 @@ Jedes Element in "suggestions" hat: category (title/path/mapping/tags/general),
 description, priority (high/medium/low)."""
 
 
+def _strip_codeblock(text: str) -> str:
+    """Entfernt einen Markdown-Codeblock um die JSON-Antwort.
+
+    Häufigster Fall: Die Antwort beginnt direkt mit ```json – dann genügt
+    Slicing zwischen erster Zeile und der ersten schließenden ``` (wie
+    beim Regex gewinnt bei mehreren Blöcken der erste).  Ergibt das kein
+    JSON-Objekt oder steht der Block nicht am Anfang, sucht
+    _CODEBLOCK_RE.  Reines JSON wird nicht durchsucht.
+    """
+    if text.startswith("```"):
+        first_newline = text.find("\n")
+        end = text.find("```", first_newline)
+        if first_newline != -1 and end > first_newline:
+            inner = text[first_newline + 1:end].strip()
+            if inner.startswith("{") and inner.endswith("}"):
+                return inner
+    if "```" not in text:
+        return text
+    codeblock_match = _CODEBLOCK_RE.search(text)
+    if codeblock_match:
+        return codeblock_match.group(1).strip()
+    return text
+
+
+def _dumps_pretty(obj: Any) -> str:
+    """Serialisiert Collector-Daten eingerückt für den Opus-Prompt.
+
+    orjson statt json.dumps(..., ensure_ascii=False, indent=2): gleiche
+    Einrückung, Umlaute bleiben ebenfalls unescaped.
+    """
+    return orjson.dumps(
+        obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
 # ---------------------------------------------------------------------------
 # Analyzer-Klasse
 # ---------------------------------------------------------------------------
@@ -289,16 +348,16 @@ class SchemaAnalyzer:
             # --- Schritt 4: JSON-Antwort parsen ---
             parsed = self._parse_response(response.text)
 
-            # --- Schritt 5: In SQLite speichern ---
-            await self._store_results(parsed, run_record)
+            # --- Schritt 5: In SQLite speichern (eine Transaktion, ein Commit) ---
+            async with self._storage.batch():
+                await self._store_results(parsed, run_record)
 
             # --- Schritt 6: Audit-Log finalisieren ---
             run_record.status = "completed"
             run_record.raw_response = response.text
-            run_record.suggestions_json = json.dumps(
+            run_record.suggestions_json = orjson.dumps(
                 [s.model_dump() for s in parsed.suggestions],
-                ensure_ascii=False,
-            )
+            ).decode()
             run_record.suggestions_count = len(parsed.suggestions)
 
             duration = time.monotonic() - start_time
@@ -422,31 +481,15 @@ class SchemaAnalyzer:
         if serialized.get("changes_since_last_run"):
             changes_section = (
                 "## Änderungen seit dem letzten Lauf\n\n"
-                + json.dumps(
-                    serialized["changes_since_last_run"],
-                    ensure_ascii=False,
-                    indent=2,
-                )
+                + _dumps_pretty(serialized["changes_since_last_run"])
                 + "\n\nBewerte, ob die Änderungen zu bestehenden Regeln "
                 "passen oder ob Regeln angepasst werden müssen."
             )
 
         user_prompt = _SCHEMA_ANALYSIS_USER_TEMPLATE.format(
-            title_groups_json=json.dumps(
-                serialized["title_groups"],
-                ensure_ascii=False,
-                indent=2,
-            ),
-            path_hierarchy_json=json.dumps(
-                serialized["path_hierarchy"],
-                ensure_ascii=False,
-                indent=2,
-            ),
-            mapping_table_json=json.dumps(
-                serialized["mapping_table"],
-                ensure_ascii=False,
-                indent=2,
-            ),
+            title_groups_json=_dumps_pretty(serialized["title_groups"]),
+            path_hierarchy_json=_dumps_pretty(serialized["path_hierarchy"]),
+            mapping_table_json=_dumps_pretty(serialized["mapping_table"]),
             changes_section=changes_section,
         )
 
@@ -476,7 +519,10 @@ class SchemaAnalyzer:
             user_message=user_prompt,
             model=self._model,
             max_tokens=self._max_output_tokens,
-            enable_cache=False,  # Schema-Prompt ändert sich bei jedem Lauf
+            # Kein Prompt Caching: Der System-Prompt ist zu kurz für das
+            # Cache-Minimum, und zwischen zwei Läufen liegen ≥24h (Cache-TTL
+            # 5 min) – es fiele nur der Cache-Write-Aufschlag an
+            enable_cache=False,
             tracking_label="schema_analysis",
             effort="low",
         )
@@ -520,31 +566,22 @@ class SchemaAnalyzer:
         cleaned = raw_text.strip()
 
         # Markdown-Codeblock entfernen
-        codeblock_match = re.search(
-            r"```(?:json)?\s*\n?(.*?)\n?\s*```",
-            cleaned,
-            re.DOTALL,
-        )
-        if codeblock_match:
-            cleaned = codeblock_match.group(1).strip()
+        cleaned = _strip_codeblock(cleaned)
 
-        # JSON parsen
+        # JSON parsen + Pydantic-Validierung in einem Durchgang (ohne
+        # Zwischen-dict); fehlertolerant dank Defaults
         try:
-            data = json.loads(cleaned)
-        except json.JSONDecodeError as exc:
-            raise ValueError(
-                f"Opus-Antwort enthält kein valides JSON: {exc}"
-            ) from exc
-
-        if not isinstance(data, dict):
-            raise ValueError(
-                f"Opus-Antwort ist kein JSON-Objekt sondern {type(data).__name__}"
-            )
-
-        # Pydantic-Validierung (fehlertolerant dank Defaults)
-        try:
-            parsed = OpusAnalysisResponse.model_validate(data)
-        except Exception as exc:
+            parsed = OpusAnalysisResponse.model_validate_json(cleaned)
+        except ValidationError as exc:
+            error_types = {error["type"] for error in exc.errors()}
+            if "json_invalid" in error_types:
+                raise ValueError(
+                    f"Opus-Antwort enthält kein valides JSON: {exc}"
+                ) from exc
+            if "model_type" in error_types and not cleaned.startswith("{"):
+                raise ValueError(
+                    "Opus-Antwort ist kein JSON-Objekt"
+                ) from exc
             raise ValueError(
                 f"Opus-Antwort konnte nicht validiert werden: {exc}"
             ) from exc
@@ -647,8 +684,9 @@ class SchemaAnalyzer:
 
         # --- Tag-Regeln (AP-11b) ---
         for tag_data in parsed.tag_rules:
-            # Korrespondent normalisieren: None/leer → '' (DB-Sentinel)
-            correspondent = (tag_data.correspondent or "").strip()
+            # Korrespondent normalisieren: None/leer → '' (DB-Sentinel);
+            # Whitespace ist bereits durch _OPUS_MODEL_CONFIG entfernt
+            correspondent = tag_data.correspondent or ""
 
             # Regeln ohne Dokumenttyp sind nicht sinnvoll → überspringen
             if not tag_data.document_type:
@@ -34,6 +34,12 @@ from app.paperless.models import Document
 
 logger = logging.getLogger(__name__)
 
+# API-Felder, die der Collector aus den Dokumenten liest (fields=-Projektion)
+_DOCUMENT_FIELDS = (
+    "id", "title", "correspondent", "document_type",
+    "storage_path", "tags", "added",
+)
+
 
 # ---------------------------------------------------------------------------
 # Datenklassen für Collector-Output
@@ -191,10 +197,12 @@ class SchemaCollector:
         # Stammdaten-Cache aktualisieren (falls seit Startup was geändert wurde)
         await self._paperless.refresh_cache()
 
-        # Alle Dokumente laden (ungefiltert, ohne NEU-Filter)
+        # Alle Dokumente laden (ungefiltert, ohne NEU-Filter).  Nur die
+        # Metadaten, die der Collector auswertet – ohne OCR-Text.
         all_documents = await self._paperless.get_documents(
             ordering="created",
             page_size=100,
+            fields=_DOCUMENT_FIELDS,
         )
         logger.info(
             "Schema-Collector: %d Dokumente geladen",
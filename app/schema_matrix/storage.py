@@ -14,6 +14,8 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -164,12 +166,37 @@ class SchemaStorage:
 
     def __init__(self, database: Database) -> None:
         self._db = database
+        # > 0 = innerhalb von batch(): Upserts committen nicht einzeln
+        self._batch_depth = 0
 
     @property
     def _conn(self) -> aiosqlite.Connection:
         """Kurzschreibweise für die DB-Connection."""
         return self._db.connection
 
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Fasst mehrere Upserts zu einer Transaktion mit einem Commit zusammen.
+
+        Innerhalb des Blocks committen die upsert_*-Methoden nicht selbst;
+        der Commit folgt einmal am Ende (ein fsync statt einem pro Zeile).
+        Auch bei einer Exception wird committet – wie bisher bleiben die
+        bereits geschriebenen Zeilen erhalten.  Ein Rollback könnte auf der
+        gemeinsamen Connection fremde, noch nicht committete Writes treffen.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                await self._conn.commit()
+
+    async def _commit_upsert(self) -> None:
+        """Commit nach einem Upsert – außer innerhalb von batch()."""
+        if self._batch_depth == 0:
+            await self._conn.commit()
+
     # =========================================================================
     # Titel-Schemata (Ebene 1)
     # =========================================================================
@@ -244,7 +271,7 @@ class SchemaStorage:
                 pattern.is_manual,
             ),
         )
-        await conn.commit()
+        await self._commit_upsert()
 
         row_id = cursor.lastrowid or 0
         # Herausfinden ob created oder updated
@@ -382,7 +409,7 @@ class SchemaStorage:
                 rule.is_manual,
             ),
         )
-        await conn.commit()
+        await self._commit_upsert()
 
         row_id = cursor.lastrowid or 0
         action = "created" if cursor.rowcount == 1 else "updated"
@@ -510,7 +537,7 @@ class SchemaStorage:
                 mapping.is_manual,
             ),
         )
-        await conn.commit()
+        await self._commit_upsert()
 
         row_id = cursor.lastrowid or 0
         action = "created" if cursor.rowcount == 1 else "updated"
@@ -659,7 +686,7 @@ class SchemaStorage:
                 rule.source,
             ),
         )
-        await conn.commit()
+        await self._commit_upsert()
 
         # Action basierend auf Existenz-Check (nicht rowcount, da SQLite
         # ON CONFLICT DO UPDATE immer rowcount=1 liefert)
@@ -7,7 +7,8 @@ Drei Auslöser, je nachdem was zuerst eintritt:
 3. **Manuell**: Via Web-UI-Button (kommt in AP-12)
 
 Mindestabstand: 24h zwischen automatischen Läufen.
-Der Trigger wird bei jedem Poller-Durchlauf geprüft.
+Der Poller prüft den Trigger höchstens alle 5 Minuten
+(SCHEMA_TRIGGER_CHECK_INTERVAL_SECONDS).
 
 AP-10: Collector & Datenmodell (Phase 3)
 """
@@ -31,7 +32,7 @@ logger = logging.getLogger(__name__)
 class SchemaTrigger:
     """Prüft ob eine Schema-Analyse ausgelöst werden soll.
 
-    Wird vom Poller bei jedem Durchlauf aufgerufen.  Die eigentliche
+    Wird vom Poller regelmäßig aufgerufen.  Die eigentliche
     Analyse wird NICHT hier durchgeführt – nur die Entscheidung ob
     sie nötig ist.
 
@@ -19,11 +19,13 @@ from typing import Any
 # ---------------------------------------------------------------------------
 
 database: Any = None            # Database | None
+http: Any = None                # httpx.AsyncClient | None (gemeinsamer Pool)
 paperless_client: Any = None    # PaperlessClient | None
 claude_client: Any = None       # ClaudeClient | None
 cost_tracker: Any = None        # CostTracker | None
 pipeline: Any = None            # ClassificationPipeline | None
 poller: Any = None              # Poller | None
+log_listener: Any = None        # logging.handlers.QueueListener | None
 
 
 # ---------------------------------------------------------------------------
@@ -35,6 +37,11 @@ def get_database() -> Any:
     return database
 
 
+def get_http_client() -> Any:
+    """Gibt den gemeinsamen httpx.AsyncClient zurück."""
+    return http
+
+
 def get_paperless_client() -> Any:
     """Gibt die PaperlessClient-Instanz zurück."""
     return paperless_client
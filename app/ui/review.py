@@ -261,7 +261,7 @@ def _get_stammdaten_options() -> dict[str, list[str]]:
             name for name in cache.get_all_tag_names() if name != "NEU"
         ),
         "storage_paths": sorted(cache.get_all_storage_path_names()),
-        "persons": cache.get_select_option_labels(CF_PERSON),
+        "persons": list(cache.get_select_option_labels(CF_PERSON)),
     }
 
 
@@ -46,14 +46,20 @@ async def _check_connections() -> dict[str, dict[str, Any]]:
         check_paperless_reachable,
         check_sqlite_writable,
     )
-    from app.state import get_database
+    from app.state import get_database, get_http_client
 
     settings = get_settings()
 
+    # Dateisystem-Check im Thread, damit er den Event-Loop nicht blockiert
+    paperless, database = await asyncio.gather(
+        check_paperless_reachable(settings, get_http_client()),
+        asyncio.to_thread(check_sqlite_writable, settings),
+    )
+
     return {
-        "paperless": await check_paperless_reachable(settings),
+        "paperless": paperless,
         "api_key": check_api_key_present(settings),
-        "database": check_sqlite_writable(settings),
+        "database": database,
         "db_initialized": {"status": "ok" if get_database() is not None else "error"},
     }
 
@@ -127,6 +133,7 @@ def _render_config() -> None:
             ("Schema-Matrix-Modell", settings.schema_matrix_model),
             ("Verarbeitungsmodus", settings.processing_mode.value),
             ("Polling-Intervall", f"{settings.polling_interval_seconds}s"),
+            ("Dokumente pro Durchlauf", str(settings.poll_batch_size)),
             ("Monatslimit", f"${settings.monthly_cost_limit_usd:.2f}"),
             ("Log-Level", settings.log_level.value),
             ("Datenverzeichnis", str(settings.data_dir)),